@@ -6,7 +6,13 @@ A Streamlit application for creating professionally formatted
 study guide chapters with DOCX and PDF export.
 """
 
+import codecs
+import hashlib
 import json
+import os
+import re
+from io import BytesIO
+from pathlib import Path, PurePosixPath
 
 import streamlit as st
 
@@ -18,20 +24,132 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Optional: incremental JSON parsing for autosave summaries
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: faster whole-file JSON parsing when ijson isn't available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import modules
 from config.constants import APP_VERSION, AUTOSAVE_DIR
 from config.subjects import load_chapters, get_categories_with_subjects, get_subject_config, get_subject_display_name, get_subject_icon
-from core.models.base import ConceptItem, ModelAnswer, PYQItem, QuestionItem
+from core.models.base import ConceptItem, ConceptTable, CustomBox, ModelAnswer, PYQItem, QuestionItem, note_edit
 from core.progress import ProgressTracker
 from core.session import SessionManager
 from styles.theme import Importance, PYQFrequency, Weightage
 from ui.components.navigation import inject_custom_css, render_breadcrumb, render_next_prev_buttons
 from ui.components.preview import show_generate_docx_button, show_preview_panel
-from ui.components.utils import render_markdown_toolbar, get_markdown_help_caption
+from ui.components.utils import (
+    bind_widget,
+    get_markdown_help_caption,
+    lazy_expander,
+    render_grid_editor,
+    render_lines_text_area,
+    render_markdown_toolbar,
+)
+from utils.autosave import atomic_open
 
 # File upload security constants
-ALLOWED_EXTENSIONS = {'json', 'docx', 'pdf', 'md', 'markdown'}
-MAX_FILE_SIZE_MB = 10
+ALLOWED_EXTENSIONS = frozenset({'json', 'docx', 'pdf', 'md', 'markdown'})
+# Control characters, path separators and ':' (NTFS alternate data streams)
+UNSAFE_FILENAME_CHARS = re.compile(r'[\x00-\x1f\x7f:\\/]')
+MAX_FILE_SIZE_MB = 10  # also enforced by server.maxUploadSize in .streamlit/config.toml
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+
+# Static widget options with precomputed index lookups
+PAGE_SIZE_OPTIONS = ("A4", "A5", "Letter", "Legal")
+PYQ_MARKS_OPTIONS = ("1M", "2M", "3M", "4M", "5M")
+DIFFICULTY_OPTIONS = ("E", "M", "H")
+DIFFICULTY_INDEX = {level: i for i, level in enumerate(DIFFICULTY_OPTIONS)}
+ANSWER_OPTIONS = ('a', 'b', 'c', 'd')
+ANSWER_INDEX = {answer: i for i, answer in enumerate(ANSWER_OPTIONS)}
+MCQ_OPTION_LABELS = tuple(f"Option ({answer})" for answer in ANSWER_OPTIONS)
+WEIGHTAGE_OPTIONS = Weightage.OPTIONS + ("Custom",)
+WEIGHTAGE_INDEX = {w: i for i, w in enumerate(Weightage.OPTIONS)}
+IMPORTANCE_INDEX = {imp: i for i, imp in enumerate(Importance.OPTIONS)}
+PYQ_FREQUENCY_INDEX = {freq: i for i, freq in enumerate(PYQFrequency.OPTIONS)}
+MAP_WORK_OPTIONS = ("Yes", "No")
+PAGE_NUMBER_POSITION_OPTIONS = ("Bottom Center", "Bottom Right", "Bottom Left")
+PAGE_NUMBER_POSITION_INDEX = {pos: i for i, pos in enumerate(PAGE_NUMBER_POSITION_OPTIONS)}
+
+# Background colors offered for concept custom boxes (name -> hex)
+BOX_COLOR_OPTIONS = {
+    "Light Grey": "#F3F4F6", "Light Blue": "#DBEAFE",
+    "Light Green": "#DCFCE7", "Light Yellow": "#FEF3C7",
+    "Light Purple": "#F3E8FF", "Light Pink": "#FEE2E2",
+}
+BOX_COLOR_NAMES = tuple(BOX_COLOR_OPTIONS)
+BOX_COLOR_NAME_BY_HEX = {hex_code: name for name, hex_code in BOX_COLOR_OPTIONS.items()}
+
+# Sidebar navigation: page id -> label, in display order
+NAV_PAGE_LABELS = {
+    "home": "🏠 Home",
+    "import_export": "📥 Import/Export",
+    "cover": "📄 Cover Page",
+    "part_a": "📊 Part A: PYQ",
+    "part_b": "📖 Part B: Concepts",
+    "part_c": "✅ Part C: Answers",
+    "part_d": "📝 Part D: Practice",
+    "part_e": "🗺️ Part E: Map Work",
+    "part_f": "🔄 Part F: Revision",
+    "part_g": "🎯 Part G: Strategy",
+    "generate": "⚙️ Generate",
+}
+NAV_PAGE_IDS = tuple(NAV_PAGE_LABELS)
+
+# Import preview: summary count key -> label, in display order
+JSON_IMPORT_COUNT_LABELS = (
+    ('concepts_count', 'concepts'),
+    ('pyq_count', 'PYQs'),
+    ('mcq_count', 'MCQs'),
+    ('model_answers_count', 'model answers'),
+)
+MD_IMPORT_COUNT_LABELS = (
+    ('concepts_count', 'concepts'),
+    ('pyq_count', 'PYQs'),
+    ('mcq_count', 'MCQs'),
+    ('short_answer_count', 'short answers'),
+    ('long_answer_count', 'long answers'),
+    ('key_points_count', 'key points'),
+    ('key_terms_count', 'key terms'),
+)
+# DOCX/PDF import: ChapterData attribute -> label, format function
+DOC_IMPORT_FIELDS = (
+    ('chapter_title', 'Title', str),
+    ('chapter_number', 'Chapter', str),
+    ('subject', 'Subject', str.title),
+    ('weightage', 'Weightage', str),
+    ('importance', 'Importance', str),
+)
+
+# Leading bytes expected for binary formats (DOCX is a ZIP container)
+FILE_SIGNATURES = {
+    'docx': b'PK\x03\x04',
+    'pdf': b'%PDF',
+}
+SNIFF_BYTES = 1024
+
+
+def _content_matches_extension(head, extension):
+    """Check the first bytes of an upload against its claimed extension."""
+    if extension in FILE_SIGNATURES:
+        return head.startswith(FILE_SIGNATURES[extension])
+
+    # Text formats: must be UTF-8 (a multi-byte char may be cut at the boundary)
+    try:
+        text = codecs.getincrementaldecoder('utf-8-sig')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return False
+
+    if extension == 'json':
+        return text.lstrip()[:1] in ('{', '[')
+    return True
 
 
 def validate_uploaded_file(uploaded_file):
@@ -47,23 +165,143 @@ def validate_uploaded_file(uploaded_file):
     if uploaded_file is None:
         return False, "No file uploaded"
 
+    # Check file size first (cheapest check)
+    if uploaded_file.size > MAX_FILE_SIZE_BYTES:
+        return False, f"File size ({uploaded_file.size / (1024*1024):.1f}MB) exceeds maximum allowed size ({MAX_FILE_SIZE_MB}MB)"
+
+    # Reject names that could be read as paths or alternate streams
+    if UNSAFE_FILENAME_CHARS.search(uploaded_file.name):
+        return False, "File name contains invalid characters"
+
     # Check file extension
-    filename = uploaded_file.name
-    if '.' not in filename:
+    extension = PurePosixPath(uploaded_file.name).suffix.lower().lstrip('.')
+    if not extension:
         return False, "File must have an extension"
 
-    extension = filename.rsplit('.', 1)[-1].lower()
     if extension not in ALLOWED_EXTENSIONS:
-        return False, f"Invalid file type '.{extension}'. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
+        return False, f"Invalid file type '.{extension}'. Allowed types: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
 
-    # Check file size
-    max_size_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
-    if uploaded_file.size > max_size_bytes:
-        return False, f"File size ({uploaded_file.size / (1024*1024):.1f}MB) exceeds maximum allowed size ({MAX_FILE_SIZE_MB}MB)"
+    # Check that the content matches the claimed type
+    head = uploaded_file.read(SNIFF_BYTES)
+    uploaded_file.seek(0)
+    if not _content_matches_extension(head, extension):
+        return False, f"File content does not match its '.{extension}' extension"
 
     return True, None
 
 
+@st.cache_data(show_spinner=False)
+def _cached_categories():
+    """Subject categories for the home page selectors (static per process)."""
+    return get_categories_with_subjects()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_chapters(class_num, subject):
+    """Chapter list for a class/subject, read from disk once per pair."""
+    return load_chapters(class_num, subject)
+
+
+@st.cache_data(show_spinner=False)
+def _qr_png(url):
+    """
+    Render a QR code for a URL as PNG bytes.
+    QR libraries are imported here so pages without QR codes don't load them.
+    """
+    buf = BytesIO()
+    try:
+        import segno  # PIL-free encoder, optional
+        segno.make(url, error='m', micro=False).save(buf, kind='png', scale=5, border=2)
+        return buf.getvalue()
+    except ImportError:
+        pass
+
+    import qrcode
+    qr = qrcode.QRCode(version=1, box_size=5, border=2)
+    qr.add_data(url)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    img.save(buf, format='PNG')
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_parse_document(file_hash, file_type, _file_bytes):
+    """
+    Parse an uploaded document once per content hash.
+    The bytes are excluded from the cache key (leading underscore) so large
+    uploads are hashed once by the caller, not again by Streamlit.
+    """
+    from core.parsers import parse_document
+    return parse_document(_file_bytes, file_type)
+
+
+def parse_uploaded_document(uploaded, file_type):
+    """Parse an uploaded file, reusing the result for re-uploads of the same content."""
+    file_bytes = uploaded.getvalue()
+    return _cached_parse_document(hashlib.sha1(file_bytes).hexdigest(), file_type, file_bytes)
+
+
+AUTOSAVE_SUMMARY_FIELDS = frozenset({'chapter_title', 'subject', 'class_num'})
+
+
+def _read_autosave_header(file):
+    """
+    Read the summary fields of an autosave's chapter_data from a binary file.
+    With ijson the parse stops as soon as the fields are found (they are
+    written first), instead of loading every concept and question.
+    """
+    if ijson is None:
+        content = file.read()
+        return (orjson.loads(content) if orjson else json.loads(content)).get('chapter_data', {})
+
+    header = {}
+    for key, value in ijson.kvitems(file, 'chapter_data'):
+        if key in AUTOSAVE_SUMMARY_FIELDS:
+            header[key] = value
+            if len(header) == len(AUTOSAVE_SUMMARY_FIELDS):
+                break
+    return header
+
+
+AUTOSAVE_READ_ERRORS = (ValueError, AttributeError, OSError) + ((ijson.JSONError,) if ijson else ())
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _autosave_meta(path_str, mtime):
+    """
+    Read the home-page summary of an autosave file.
+    Cached per (path, mtime), so a file is only re-parsed after it is rewritten;
+    every save adds a key, hence the bounded cache.
+    Returns None for corrupted or invalid files.
+    """
+    try:
+        with open(path_str, 'rb') as file:
+            ch_data = _read_autosave_header(file)
+        return {
+            # Fields can be present but null in hand-edited or older files
+            'title': (ch_data.get('chapter_title') or 'Untitled')[:30],
+            'subject': (ch_data.get('subject') or 'unknown').replace('_', ' ').title(),
+            'class_num': ch_data.get('class_num') or 10,
+        }
+    except AUTOSAVE_READ_ERRORS:
+        return None
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _recent_autosaves(dir_mtime, limit=5):
+    """
+    Newest autosave files as (path, mtime) pairs, newest first.
+    Keyed on the directory's mtime: saves go through atomic_open, whose
+    rename updates it, so the glob/stat pass only reruns after files change.
+    """
+    with os.scandir(AUTOSAVE_DIR) as entries:
+        files = [(entry.path, entry.stat().st_mtime) for entry in entries
+                 if entry.name.endswith('.json') and entry.is_file()]
+    files.sort(key=lambda x: x[1], reverse=True)
+    return files[:limit]
+
+
 def init_session():
     """Initialize session state."""
     SessionManager.initialize()
@@ -73,6 +311,28 @@ def init_session():
         st.session_state.current_page = 'home'
 
 
+def get_sidebar_progress(data):
+    """
+    Get (overall percentage, per-section display rows) for the sidebar.
+    Recomputed only when the session's data revision changes.
+    """
+    revision = SessionManager.get_data_revision()
+    cached = st.session_state.get('sidebar_progress')
+    if cached and cached[0] == revision:
+        return cached[1]
+
+    tracker = ProgressTracker(data, SessionManager.get_part_manager())
+    all_progress = tracker.get_all_progress()
+    result = (tracker.get_overall_progress(all_progress), tracker.get_sidebar_display(all_progress))
+    st.session_state.sidebar_progress = (revision, result)
+    return result
+
+
+def _on_nav_change():
+    """Sidebar radio callback: switch page before the script reruns."""
+    st.session_state.current_page = st.session_state.nav_radio
+
+
 def render_sidebar():
     """Render the sidebar with navigation and progress."""
     with st.sidebar:
@@ -100,9 +360,8 @@ def render_sidebar():
                 save_type = "primary" if is_dirty else "secondary"
                 save_label = "💾 Save" if not is_dirty else "💾 Save*"
                 if st.button(save_label, key="quick_save", type=save_type, use_container_width=True):
-                    save_chapter()
-                    st.toast("Project saved successfully!", icon="✅")
-                    st.rerun()
+                    # Saved at the end of the run, once the page has applied this run's edits
+                    st.session_state['_save_requested'] = True
             
             with col2:
                 # Reset Button
@@ -131,84 +390,64 @@ def render_sidebar():
             st.caption(f"Ch {data.chapter_number}: {data.chapter_title[:30] if data.chapter_title else 'Untitled'}")
 
             # Progress
-            part_manager = SessionManager.get_part_manager()
-            tracker = ProgressTracker(data, part_manager)
-            progress = tracker.get_overall_progress()
+            progress, sidebar_display = get_sidebar_progress(data)
 
             st.progress(progress / 100)
             
             # Compact section progress
             with st.expander("📊 Detailed Progress"):
-                for name, status, pct in tracker.get_sidebar_display():
-                    st.markdown(f"<div style='display:flex; justify-content:space-between; font-size:0.85rem'><span>{status} {name}</span><span>{pct:.0f}%</span></div>", unsafe_allow_html=True)
+                rows_html = "".join(
+                    f"<div style='display:flex; justify-content:space-between; font-size:0.85rem'><span>{status} {name}</span><span>{pct:.0f}%</span></div>"
+                    for name, status, pct in sidebar_display
+                )
+                st.markdown(rows_html, unsafe_allow_html=True)
 
             st.divider()
 
         # Navigation
         st.subheader("🧭 Navigation")
 
-        # Get progress data for badges
-        progress_map = {}
-        if data:
-            progress_map = {
-                'cover': tracker.calculate_cover_progress(),
-                'part_a': tracker.calculate_part_a_progress(),
-                'part_b': tracker.calculate_part_b_progress(),
-                'part_c': tracker.calculate_part_c_progress(),
-                'part_d': tracker.calculate_part_d_progress(),
-                'part_e': tracker.calculate_part_e_progress(),
-                'part_f': tracker.calculate_part_f_progress(),
-                'part_g': tracker.calculate_part_g_progress(),
-            }
-
-        pages = [
-            ("🏠 Home", "home"),
-            ("📥 Import/Export", "import_export"),
-            ("📄 Cover Page", "cover"),
-            ("📊 Part A: PYQ", "part_a"),
-            ("📖 Part B: Concepts", "part_b"),
-            ("✅ Part C: Answers", "part_c"),
-            ("📝 Part D: Practice", "part_d"),
-            ("🗺️ Part E: Map Work", "part_e"),
-            ("🔄 Part F: Revision", "part_f"),
-            ("🎯 Part G: Strategy", "part_g"),
-            ("⚙️ Generate", "generate"),
-        ]
-
+        # Keep the radio in sync when the page changes elsewhere (next/prev, create, import)
         current_page = st.session_state.get('current_page', 'home')
-
-        for label, page_id in pages:
-            # Add progress badge for applicable pages
-            progress = progress_map.get(page_id, None)
-            display_label = label
-            
-            # Highlight current page
-            button_type = "primary" if page_id == current_page else "secondary"
-            
-            # Simple button for nav
-            if st.button(display_label, key=f"nav_{page_id}", use_container_width=True, type=button_type):
-                st.session_state.current_page = page_id
-                st.rerun()
+        if st.session_state.get('nav_radio') != current_page:
+            st.session_state.nav_radio = current_page
+
+        st.radio(
+            "Navigation",
+            NAV_PAGE_IDS,
+            format_func=NAV_PAGE_LABELS.get,
+            key="nav_radio",
+            on_change=_on_nav_change,
+            label_visibility="collapsed"
+        )
 
         st.divider()
 
         # Page Setup
         if data:
-            with st.expander("📄 Page Setup"):
-                page_size = st.selectbox(
-                    "Size",
-                    ["A4", "A5", "Letter", "Legal"],
-                    index=["A4", "A5", "Letter", "Legal"].index(data.page_size),
-                    key="sidebar_page_size"
-                )
-                data.page_size = page_size
+            render_sidebar_page_setup(data)
 
-                add_page_numbers = st.checkbox(
-                    "Page Numbers",
-                    value=data.add_page_numbers,
-                    key="sidebar_add_page_numbers"
-                )
-                data.add_page_numbers = add_page_numbers
+
+@st.fragment
+def render_sidebar_page_setup(data):
+    """
+    Render the sidebar Page Setup controls.
+    Runs as a fragment: changing them doesn't rerun the current page.
+    """
+    with st.expander("📄 Page Setup"):
+        # Also set from the Generate page, so both stay synced to the chapter
+        st.selectbox(
+            "Size",
+            PAGE_SIZE_OPTIONS,
+            **bind_widget("sidebar_page_size", data, "page_size", sync=True)
+        )
+        st.checkbox(
+            "Page Numbers",
+            **bind_widget("sidebar_add_page_numbers", data, "add_page_numbers", sync=True)
+        )
+
+    # A fragment rerun never reaches the page's commit; no-op unless a value changed
+    SessionManager.set_chapter_data(data)
 
 
 def render_home_page():
@@ -227,7 +466,7 @@ def render_home_page():
         class_num = st.selectbox("Select Class", [10, 9], key="new_class")
 
         # Subject Category selection
-        categories = get_categories_with_subjects()
+        categories = _cached_categories()
         category_names = list(categories.keys())
         category_display = [f"{categories[c]['icon']} {c}" for c in category_names]
 
@@ -251,7 +490,7 @@ def render_home_page():
         subject = cat_subjects[subject_idx]['id']
 
         # Chapter selection
-        chapters = load_chapters(class_num, subject)
+        chapters = _cached_chapters(class_num, subject)
 
         if chapters:
             chapter_options = [f"Ch {c['number']}: {c['title']}" for c in chapters]
@@ -299,34 +538,36 @@ def render_home_page():
     with col2:
         st.subheader("📂 Recent Chapters")
 
-        # List autosaved files
-        autosave_files = list(AUTOSAVE_DIR.glob("*.json"))
-        autosave_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        # List autosaved files (newest first)
+        autosave_files = _recent_autosaves(AUTOSAVE_DIR.stat().st_mtime)
 
         if autosave_files:
-            for f in autosave_files[:5]:
+            for path_str, mtime in autosave_files:
+                f = Path(path_str)
+                meta = _autosave_meta(path_str, mtime)
+                if meta is None:
+                    # Skip corrupted or invalid autosave files
+                    continue
+
                 with st.container():
-                    try:
-                        with open(f, 'r', encoding='utf-8') as file:
-                            saved_data = json.load(file)
-                            ch_data = saved_data.get('chapter_data', {})
-                            title = ch_data.get('chapter_title', 'Untitled')[:30]
-                            subject = ch_data.get('subject', 'unknown').replace('_', ' ').title()
-                            class_n = ch_data.get('class_num', 10)
-
-                            col_a, col_b = st.columns([3, 1])
-                            with col_a:
-                                st.write(f"**{title}**")
-                                st.caption(f"Class {class_n} | {subject}")
-                            with col_b:
-                                if st.button("Load", key=f"load_{f.name}"):
-                                    with open(f, 'r', encoding='utf-8') as file:
-                                        SessionManager.import_from_json(file.read())
+                    col_a, col_b = st.columns([3, 1])
+                    with col_a:
+                        st.write(f"**{meta['title']}**")
+                        st.caption(f"Class {meta['class_num']} | {meta['subject']}")
+                    with col_b:
+                        if st.button("Load", key=f"load_{f.name}"):
+                            try:
+                                content = f.read_bytes()
+                            except OSError as e:
+                                # The file may have been removed since the listing was cached
+                                st.error(f"Could not open {f.name}: {e.strerror or e}")
+                            else:
+                                result = SessionManager.import_from_json(content)
+                                if result['success']:
                                     st.session_state.current_page = 'cover'
                                     st.rerun()
-                    except (json.JSONDecodeError, KeyError, OSError):
-                        # Skip corrupted or invalid autosave files
-                        continue
+                                st.error("Import failed:\n"
+                                         + "\n".join(f"- {error}" for error in result.get('errors', ['Unknown error'])))
                 st.divider()
         else:
             st.info("No recent chapters found. Create a new one to get started!")
@@ -347,21 +588,13 @@ def render_cover_page():
         col1, col2 = st.columns([3, 1])
 
         with col1:
-            if "ch_title" not in st.session_state:
-                st.session_state.ch_title = data.chapter_title
-            new_title = st.text_input("Chapter Title", key="ch_title")
-            data.chapter_title = new_title
-
-            if "ch_subtitle" not in st.session_state:
-                st.session_state.ch_subtitle = data.subtitle or ""
-            new_subtitle = st.text_input("Subtitle (optional)", key="ch_subtitle")
-            data.subtitle = new_subtitle if new_subtitle else None
+            st.text_input("Chapter Title", **bind_widget("ch_title", data, "chapter_title"))
+            st.text_input("Subtitle (optional)",
+                          **bind_widget("ch_subtitle", data, "subtitle", empty_as_none=True))
 
         with col2:
-            if "ch_num" not in st.session_state:
-                st.session_state.ch_num = data.chapter_number
-            new_num = st.number_input("Chapter Number", min_value=1, max_value=50, key="ch_num")
-            data.chapter_number = new_num
+            st.number_input("Chapter Number", min_value=1, max_value=50,
+                            **bind_widget("ch_num", data, "chapter_number"))
 
     # Metadata Section
     with st.container(border=True):
@@ -369,13 +602,11 @@ def render_cover_page():
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            weightage_options = Weightage.OPTIONS + ["Custom"]
-            is_custom = data.weightage not in Weightage.OPTIONS
-            weightage_idx = len(weightage_options) - 1 if is_custom else Weightage.OPTIONS.index(data.weightage)
+            is_custom = data.weightage not in WEIGHTAGE_INDEX
             
             if "ch_weightage" not in st.session_state:
-                st.session_state.ch_weightage = weightage_options[weightage_idx]
-            selected_weightage = st.selectbox("Weightage", weightage_options, key="ch_weightage")
+                st.session_state.ch_weightage = "Custom" if is_custom else data.weightage
+            selected_weightage = st.selectbox("Weightage", WEIGHTAGE_OPTIONS, key="ch_weightage")
 
             if selected_weightage == "Custom":
                 if "ch_weightage_custom" not in st.session_state:
@@ -386,39 +617,32 @@ def render_cover_page():
                 data.weightage = selected_weightage
 
         with col2:
-            map_idx = 0 if data.map_work == "Yes" else 1
             if "ch_map" not in st.session_state:
-                st.session_state.ch_map = ["Yes", "No"][map_idx]
-            new_map = st.selectbox("Map Work", ["Yes", "No"], key="ch_map")
+                st.session_state.ch_map = "Yes" if data.map_work == "Yes" else "No"
+            new_map = st.selectbox("Map Work", MAP_WORK_OPTIONS, key="ch_map")
             data.map_work = new_map
 
         with col3:
-            imp_idx = Importance.OPTIONS.index(data.importance) if data.importance in Importance.OPTIONS else 0
             if "ch_importance" not in st.session_state:
-                st.session_state.ch_importance = Importance.OPTIONS[imp_idx]
+                st.session_state.ch_importance = Importance.OPTIONS[IMPORTANCE_INDEX.get(data.importance, 0)]
             new_importance = st.selectbox("Importance", Importance.OPTIONS, key="ch_importance")
             data.importance = new_importance
 
         with col4:
-            freq_idx = PYQFrequency.OPTIONS.index(data.pyq_frequency) if data.pyq_frequency in PYQFrequency.OPTIONS else 0
             if "ch_freq" not in st.session_state:
-                st.session_state.ch_freq = PYQFrequency.OPTIONS[freq_idx]
+                st.session_state.ch_freq = PYQFrequency.OPTIONS[PYQ_FREQUENCY_INDEX.get(data.pyq_frequency, 0)]
             new_freq = st.selectbox("PYQ Frequency", PYQFrequency.OPTIONS, key="ch_freq")
             data.pyq_frequency = new_freq
 
     # Syllabus Alert
     with st.container(border=True):
         st.subheader("⚠️ Syllabus Alert")
-        if "alert_enabled" not in st.session_state:
-            st.session_state.alert_enabled = data.syllabus_alert_enabled
-        alert_enabled = st.checkbox("Enable Syllabus Alert", key="alert_enabled")
-        data.syllabus_alert_enabled = alert_enabled
+        alert_enabled = st.checkbox("Enable Syllabus Alert",
+                                    **bind_widget("alert_enabled", data, "syllabus_alert_enabled"))
 
         if alert_enabled:
-            if "alert_text" not in st.session_state:
-                st.session_state.alert_text = data.syllabus_alert_text
-            alert_text = st.text_area("Alert Text", placeholder="Enter syllabus alert message...", key="alert_text")
-            data.syllabus_alert_text = alert_text
+            st.text_area("Alert Text", placeholder="Enter syllabus alert message...",
+                         **bind_widget("alert_text", data, "syllabus_alert_text"))
 
     # Learning Objectives
     with st.container(border=True):
@@ -436,11 +660,17 @@ def render_cover_page():
 
     # Part Descriptions
     with st.expander("📑 Part Descriptions (for Chapter Contents box)"):
+        desc_changes = {}
         for part_id in ['A', 'B', 'C', 'D', 'E', 'F', 'G']:
+            current = data.part_descriptions.get(part_id, '')
             desc = st.text_input(f"Part {part_id} Description",
-                                value=data.part_descriptions.get(part_id, ''),
+                                value=current,
                                 key=f"part_desc_{part_id}")
-            data.part_descriptions[part_id] = desc
+            if desc != current:
+                desc_changes[part_id] = desc
+        if desc_changes:
+            # Assign a new dict so the edit is tracked like any other field
+            data.part_descriptions = {**data.part_descriptions, **desc_changes}
 
     # QR Codes Section
     with st.container(border=True):
@@ -449,14 +679,12 @@ def render_cover_page():
 
         col1, col2 = st.columns(2)
         with col1:
-            qr_url_1 = st.text_input("Practice Questions PDF URL", value=data.qr_practice_questions_url or "",
-                                    placeholder="https://drive.google.com/...", key="qr_practice_url")
-            data.qr_practice_questions_url = qr_url_1 if qr_url_1 else None
+            st.text_input("Practice Questions PDF URL", placeholder="https://drive.google.com/...",
+                          **bind_widget("qr_practice_url", data, "qr_practice_questions_url", empty_as_none=True))
 
         with col2:
-            qr_url_2 = st.text_input("Practice Questions with Answers PDF URL", value=data.qr_practice_with_answers_url or "",
-                                    placeholder="https://drive.google.com/...", key="qr_answers_url")
-            data.qr_practice_with_answers_url = qr_url_2 if qr_url_2 else None
+            st.text_input("Practice Questions with Answers PDF URL", placeholder="https://drive.google.com/...",
+                          **bind_widget("qr_answers_url", data, "qr_practice_with_answers_url", empty_as_none=True))
 
         # QR Preview logic remains same...
         if data.qr_practice_questions_url or data.qr_practice_with_answers_url:
@@ -467,30 +695,14 @@ def render_cover_page():
             with qr_col1:
                 if data.qr_practice_questions_url:
                     try:
-                        from io import BytesIO
-                        import qrcode
-                        qr = qrcode.QRCode(version=1, box_size=5, border=2)
-                        qr.add_data(data.qr_practice_questions_url)
-                        qr.make(fit=True)
-                        img = qr.make_image(fill_color="black", back_color="white")
-                        buf = BytesIO()
-                        img.save(buf, format='PNG')
-                        st.image(buf.getvalue(), caption="Practice Questions", width=150)
+                        st.image(_qr_png(data.qr_practice_questions_url), caption="Practice Questions", width=150)
                     except Exception as e:
                         st.error(f"QR Error: {e}")
 
             with qr_col2:
                 if data.qr_practice_with_answers_url:
                     try:
-                        from io import BytesIO
-                        import qrcode
-                        qr = qrcode.QRCode(version=1, box_size=5, border=2)
-                        qr.add_data(data.qr_practice_with_answers_url)
-                        qr.make(fit=True)
-                        img = qr.make_image(fill_color="black", back_color="white")
-                        buf = BytesIO()
-                        img.save(buf, format='PNG')
-                        st.image(buf.getvalue(), caption="With Answers", width=150)
+                        st.image(_qr_png(data.qr_practice_with_answers_url), caption="With Answers", width=150)
                     except Exception as e:
                         st.error(f"QR Error: {e}")
 
@@ -525,8 +737,7 @@ def render_part_a():
     # Year Range
     col1, col2 = st.columns(2)
     with col1:
-        year_range = st.text_input("Year Range", value=data.pyq_year_range, key="pyq_year_range")
-        data.pyq_year_range = year_range
+        st.text_input("Year Range", **bind_widget("pyq_year_range", data, "pyq_year_range"))
 
     st.divider()
 
@@ -535,65 +746,52 @@ def render_part_a():
     st.caption("Format: Question | Marks (e.g., 3M or 5M) | Years (comma-separated)")
 
     # Add new PYQ
-    with st.expander("➕ Add New PYQ"):
+    # (a form, so typing here doesn't rerun the page until Add PYQ is pressed)
+    with st.expander("➕ Add New PYQ"), st.form("add_pyq_form", clear_on_submit=True, border=False):
         new_q = st.text_area("Question", key="new_pyq_q")
         col1, col2 = st.columns(2)
         with col1:
-            new_marks = st.selectbox("Marks", ["1M", "2M", "3M", "4M", "5M"], index=2, key="new_pyq_marks")
+            new_marks = st.selectbox("Marks", PYQ_MARKS_OPTIONS, index=2, key="new_pyq_marks")
         with col2:
             new_years = st.text_input("Years Asked (comma-separated)", key="new_pyq_years",
                                       placeholder="2020, 2021, 2023")
 
-        if st.button("Add PYQ", key="add_pyq"):
+        if st.form_submit_button("Add PYQ"):
             if new_q:
                 data.pyq_items.append(PYQItem(
                     question=new_q,
                     marks=new_marks,
                     years=new_years
                 ))
+                note_edit()
                 st.success("Added!")
-                st.rerun()
 
-    # Display existing PYQs
-    for idx, item in enumerate(data.pyq_items):
-        with st.container():
-            col1, col2, col3, col4 = st.columns([4, 1, 2, 1])
-
-            with col1:
-                q = st.text_area(f"Question {idx+1}", value=item.question,
-                                key=f"pyq_q_{idx}", height=80)
-                item.question = q
+    # Existing PYQs as one editable grid (add/delete rows in place)
+    pyq_rows = render_grid_editor(
+        "pyq_editor",
+        [{'question': p.question, 'marks': p.marks, 'years': p.years} for p in data.pyq_items],
+        ['question', 'marks', 'years'],
+        column_config={
+            'question': st.column_config.TextColumn("Question", width="large"),
+            'marks': st.column_config.SelectboxColumn("Marks", options=PYQ_MARKS_OPTIONS, default="3M"),
+            'years': st.column_config.TextColumn("Years"),
+        },
+    )
+    data.pyq_items = [PYQItem(**row) for row in pyq_rows]
 
-            with col2:
-                m = st.selectbox("Marks", ["1M", "2M", "3M", "4M", "5M"],
-                                index=["1M", "2M", "3M", "4M", "5M"].index(item.marks) if item.marks in ["1M", "2M", "3M", "4M", "5M"] else 2,
-                                key=f"pyq_m_{idx}")
-                item.marks = m
-
-            with col3:
-                y = st.text_input("Years", value=item.years, key=f"pyq_y_{idx}")
-                item.years = y
-
-            with col4:
-                if st.button("🗑️", key=f"del_pyq_{idx}"):
-                    data.pyq_items.pop(idx)
-                    st.rerun()
-
-            st.divider()
+    st.divider()
 
     # Prediction
     st.subheader("🎯 Prediction")
-    prediction = st.text_area("Prediction for next exam", value=data.pyq_prediction,
-                             placeholder="German Unification (5M) + French Revolution (3M) + ...",
-                             key="pyq_prediction")
-    data.pyq_prediction = prediction
+    st.text_area("Prediction for next exam",
+                 placeholder="German Unification (5M) + French Revolution (3M) + ...",
+                 **bind_widget("pyq_prediction", data, "pyq_prediction"))
 
     # Syllabus Note
     st.subheader("📌 Syllabus Note")
-    syllabus_note = st.text_area("Syllabus Note (optional)", value=data.pyq_syllabus_note or "",
-                                placeholder="This chapter has remained unchanged since...",
-                                key="pyq_syllabus_note")
-    data.pyq_syllabus_note = syllabus_note if syllabus_note else None
+    st.text_area("Syllabus Note (optional)",
+                 placeholder="This chapter has remained unchanged since...",
+                 **bind_widget("pyq_syllabus_note", data, "pyq_syllabus_note", empty_as_none=True))
 
     SessionManager.set_chapter_data(data)
 
@@ -628,193 +826,13 @@ def render_part_b():
         if st.button("➕ Add Concept", type="primary", use_container_width=True):
             new_num = len(data.concepts) + 1
             data.concepts.append(ConceptItem(number=new_num))
-            st.rerun()
+            note_edit()
 
     st.markdown("<br>", unsafe_allow_html=True)
 
     # Display concepts
     for idx, concept in enumerate(data.concepts):
-        # Determine expander title
-        expander_title = f"#{concept.number} {concept.title}" if concept.title else f"Concept #{concept.number}"
-        
-        with st.expander(expander_title, expanded=idx == 0):
-            # Top row: Title and Delete
-            col1, col2 = st.columns([5, 1])
-            with col1:
-                title = st.text_input("Concept Title", value=concept.title, key=f"concept_title_{idx}",
-                                     placeholder="e.g., The French Revolution")
-                concept.title = title
-            with col2:
-                if st.button("🗑️", key=f"del_concept_{idx}", help="Delete this concept"):
-                    data.concepts.pop(idx)
-                    # Renumber
-                    for i, c in enumerate(data.concepts):
-                        c.number = i + 1
-                    st.rerun()
-
-            # Tabs for different content types
-            tab_main, tab_tables, tab_extras = st.tabs(["📝 Main Content", "📊 Tables", "✨ Extras"])
-
-            # --- Main Content Tab ---
-            with tab_main:
-                # NCERT Line
-                if f"concept_ncert_{idx}" not in st.session_state:
-                    st.session_state[f"concept_ncert_{idx}"] = concept.ncert_line or ""
-                ncert = st.text_input("NCERT Exact Line (optional)",
-                                     key=f"concept_ncert_{idx}",
-                                     placeholder="The first clear expression of nationalism came with...")
-                concept.ncert_line = ncert if ncert else None
-
-                # Content
-                st.caption("Main explanation (supports markdown)")
-                render_markdown_toolbar(f"concept_content_{idx}")
-                if f"concept_content_{idx}" not in st.session_state:
-                    st.session_state[f"concept_content_{idx}"] = concept.content
-                content = st.text_area("Content", height=200,
-                                      key=f"concept_content_{idx}",
-                                      label_visibility="collapsed",
-                                      placeholder="Main content with **bold**, *italic*, and bullet points (-)")
-                concept.content = content
-                
-                st.caption(f"Word count: {concept.word_count()}")
-
-            # --- Tables Tab ---
-            with tab_tables:
-                st.info("Add comparison tables or data charts for this concept.")
-                
-                for tbl_idx, tbl in enumerate(concept.tables):
-                    with st.container():
-                        st.markdown(f"**Table {tbl_idx + 1}**")
-                        if f"tbl_title_{idx}_{tbl_idx}" not in st.session_state:
-                            st.session_state[f"tbl_title_{idx}_{tbl_idx}"] = tbl.title
-                        tbl.title = st.text_input("Table Title",
-                                                 key=f"tbl_title_{idx}_{tbl_idx}",
-                                                 placeholder="e.g., Comparison of Events")
-
-                        # Headers management
-                        col_h_disp, col_h_act = st.columns([4, 1])
-                        with col_h_disp:
-                            st.caption(f"Columns: {len(tbl.headers)}")
-                        with col_h_act:
-                            col_btns = st.columns(2)
-                            with col_btns[0]:
-                                if st.button("➕", key=f"add_col_{idx}_{tbl_idx}", help="Add column"):
-                                    tbl.headers.append(f"Col {len(tbl.headers)+1}")
-                                    for row in tbl.rows:
-                                        row.append("")
-                                    st.rerun()
-                            with col_btns[1]:
-                                if len(tbl.headers) > 1 and st.button("➖", key=f"del_col_{idx}_{tbl_idx}", help="Remove last column"):
-                                    tbl.headers.pop()
-                                    for row in tbl.rows:
-                                        if row: row.pop()
-                                    st.rerun()
-                        
-                        # Headers Inputs
-                        header_cols = st.columns(len(tbl.headers))
-                        for h_idx, header in enumerate(tbl.headers):
-                            with header_cols[h_idx]:
-                                if f"tbl_h_{idx}_{tbl_idx}_{h_idx}" not in st.session_state:
-                                    st.session_state[f"tbl_h_{idx}_{tbl_idx}_{h_idx}"] = header
-                                tbl.headers[h_idx] = st.text_input(f"H{h_idx+1}", 
-                                                                 key=f"tbl_h_{idx}_{tbl_idx}_{h_idx}", 
-                                                                 label_visibility="collapsed")
-
-                        # Rows
-                        st.markdown("Rows")
-                        for r_idx, row in enumerate(tbl.rows):
-                            row_cols = st.columns(len(tbl.headers) + 1)
-                            for c_idx in range(len(tbl.headers)):
-                                with row_cols[c_idx]:
-                                    if c_idx < len(row):
-                                        if f"tbl_cell_{idx}_{tbl_idx}_{r_idx}_{c_idx}" not in st.session_state:
-                                            st.session_state[f"tbl_cell_{idx}_{tbl_idx}_{r_idx}_{c_idx}"] = row[c_idx]
-                                        row[c_idx] = st.text_input(f"R{r_idx}C{c_idx}",
-                                                                  key=f"tbl_cell_{idx}_{tbl_idx}_{r_idx}_{c_idx}",
-                                                                  label_visibility="collapsed")
-                            with row_cols[-1]:
-                                if st.button("🗑️", key=f"del_row_{idx}_{tbl_idx}_{r_idx}"):
-                                    tbl.rows.pop(r_idx)
-                                    st.rerun()
-
-                        # Row Actions
-                        btn_cols = st.columns([1, 4])
-                        with btn_cols[0]:
-                            if st.button("➕ Row", key=f"add_row_{idx}_{tbl_idx}"):
-                                tbl.rows.append([""] * len(tbl.headers))
-                                st.rerun()
-                        with btn_cols[1]:
-                            if st.button("Delete Table", key=f"del_tbl_{idx}_{tbl_idx}"):
-                                concept.tables.pop(tbl_idx)
-                                st.rerun()
-                        
-                        st.divider()
-
-                if st.button("➕ Add Table", key=f"add_tbl_{idx}"):
-                    from core.models.base import ConceptTable
-                    concept.tables.append(ConceptTable())
-                    st.rerun()
-
-            # --- Extras Tab ---
-            with tab_extras:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("**🧠 Memory Trick**")
-                    if f"concept_trick_{idx}" not in st.session_state:
-                        st.session_state[f"concept_trick_{idx}"] = concept.memory_trick or ""
-                    trick = st.text_area("Mnemonic/Trick", key=f"concept_trick_{idx}", height=100,
-                                         placeholder="FLAT-CUN — Flag, Language, Assembly...")
-                    concept.memory_trick = trick if trick else None
-
-                with col2:
-                    st.markdown("**💡 Did You Know?**")
-                    if f"concept_dyk_{idx}" not in st.session_state:
-                        st.session_state[f"concept_dyk_{idx}"] = concept.did_you_know or ""
-                    dyk = st.text_area("Interesting Fact", height=100, key=f"concept_dyk_{idx}",
-                                      placeholder="Interesting fact...")
-                    concept.did_you_know = dyk if dyk else None
-
-                st.divider()
-                st.markdown("**🎨 Custom Colored Boxes**")
-
-                COLOR_OPTIONS = {
-                    "Light Grey": "#F3F4F6", "Light Blue": "#DBEAFE", 
-                    "Light Green": "#DCFCE7", "Light Yellow": "#FEF3C7",
-                    "Light Purple": "#F3E8FF", "Light Pink": "#FEE2E2",
-                }
-
-                for box_idx, box in enumerate(concept.custom_boxes):
-                    with st.container():
-                        c1, c2, c3 = st.columns([3, 2, 1])
-                        with c1:
-                            if f"box_title_{idx}_{box_idx}" not in st.session_state:
-                                st.session_state[f"box_title_{idx}_{box_idx}"] = box.title
-                            box.title = st.text_input("Box Title",
-                                                      key=f"box_title_{idx}_{box_idx}",
-                                                      placeholder="e.g., Important Note")
-                        with c2:
-                            color_name = next((k for k, v in COLOR_OPTIONS.items() if v == box.background_color), "Light Grey")
-                            if f"box_color_{idx}_{box_idx}" not in st.session_state:
-                                st.session_state[f"box_color_{idx}_{box_idx}"] = color_name
-                            selected = st.selectbox("Color", list(COLOR_OPTIONS.keys()),
-                                                   key=f"box_color_{idx}_{box_idx}")
-                            box.background_color = COLOR_OPTIONS[selected]
-                        with c3:
-                            if st.button("🗑️", key=f"del_box_{idx}_{box_idx}"):
-                                concept.custom_boxes.pop(box_idx)
-                                st.rerun()
-
-                        if f"box_content_{idx}_{box_idx}" not in st.session_state:
-                            st.session_state[f"box_content_{idx}_{box_idx}"] = box.content
-                        box.content = st.text_area("Box Content", height=80,
-                                                  key=f"box_content_{idx}_{box_idx}")
-                        st.divider()
-
-                if st.button("➕ Add Colored Box", key=f"add_box_{idx}"):
-                    from core.models.base import CustomBox
-                    concept.custom_boxes.append(CustomBox())
-                    st.rerun()
+        render_concept_item(data, idx, concept)
 
     SessionManager.set_chapter_data(data)
 
@@ -834,6 +852,175 @@ def render_part_b():
         st.rerun()
 
 
+@st.fragment
+def render_concept_item(data, idx, concept):
+    """
+    Render the editor for one concept.
+    Runs as a fragment: edits inside the concept only rerun this block.
+    """
+    # Determine expander title
+    expander_title = f"#{concept.number} {concept.title}" if concept.title else f"Concept #{concept.number}"
+
+    expander = lazy_expander(expander_title, f"exp_concept_{concept.widget_key}", expanded=idx == 0)
+    with expander:
+        if not expander.open:
+            return
+
+        # Top row: Title and Delete
+        col1, col2 = st.columns([5, 1])
+        with col1:
+            st.text_input("Concept Title", placeholder="e.g., The French Revolution",
+                          **bind_widget(f"concept_title_{concept.widget_key}", concept, "title"))
+        with col2:
+            if st.button("🗑️", key=f"del_concept_{concept.widget_key}", help="Delete this concept"):
+                data.concepts.pop(idx)
+                note_edit()
+                # Renumber the concepts that moved up
+                for i in range(idx, len(data.concepts)):
+                    data.concepts[i].number = i + 1
+                st.rerun()
+
+        # Tabs for different content types
+        tab_main, tab_tables, tab_extras = st.tabs(["📝 Main Content", "📊 Tables", "✨ Extras"])
+
+        # --- Main Content Tab ---
+        with tab_main:
+            # NCERT Line
+            st.text_input("NCERT Exact Line (optional)",
+                          placeholder="The first clear expression of nationalism came with...",
+                          **bind_widget(f"concept_ncert_{concept.widget_key}", concept, "ncert_line",
+                                        empty_as_none=True))
+
+            # Content
+            st.caption("Main explanation (supports markdown)")
+            render_markdown_toolbar(f"concept_content_{concept.widget_key}")
+            if f"concept_content_{concept.widget_key}" not in st.session_state:
+                st.session_state[f"concept_content_{concept.widget_key}"] = concept.content
+            content = st.text_area("Content", height=200,
+                                  key=f"concept_content_{concept.widget_key}",
+                                  label_visibility="collapsed",
+                                  placeholder="Main content with **bold**, *italic*, and bullet points (-)")
+            concept.content = content
+
+            st.caption(f"Word count: {concept.word_count()}")
+
+        # --- Tables Tab ---
+        with tab_tables:
+            st.info("Add comparison tables or data charts for this concept.")
+
+            for tbl_idx, tbl in enumerate(concept.tables):
+                with st.container():
+                    st.markdown(f"**Table {tbl_idx + 1}**")
+                    st.text_input("Table Title", placeholder="e.g., Comparison of Events",
+                                  **bind_widget(f"tbl_title_{tbl.widget_key}", tbl, "title"))
+
+                    # Headers management
+                    col_h_disp, col_h_act = st.columns([4, 1])
+                    with col_h_act:
+                        col_btns = st.columns(2)
+                        with col_btns[0]:
+                            if st.button("➕", key=f"add_col_{tbl.widget_key}", help="Add column"):
+                                tbl.headers.append(f"Col {len(tbl.headers)+1}")
+                                for row in tbl.rows:
+                                    row.append("")
+                                note_edit()
+                        with col_btns[1]:
+                            if len(tbl.headers) > 1 and st.button("➖", key=f"del_col_{tbl.widget_key}", help="Remove last column"):
+                                tbl.headers.pop()
+                                for row in tbl.rows:
+                                    if row: row.pop()
+                                note_edit()
+                    with col_h_disp:
+                        st.caption(f"Columns: {len(tbl.headers)}")
+
+                    # Headers Inputs
+                    header_cols = st.columns(len(tbl.headers))
+                    headers = list(tbl.headers)
+                    for h_idx, header in enumerate(headers):
+                        with header_cols[h_idx]:
+                            if f"tbl_h_{tbl.widget_key}_{h_idx}" not in st.session_state:
+                                st.session_state[f"tbl_h_{tbl.widget_key}_{h_idx}"] = header
+                            headers[h_idx] = st.text_input(f"H{h_idx+1}", 
+                                                           key=f"tbl_h_{tbl.widget_key}_{h_idx}", 
+                                                           label_visibility="collapsed")
+                    tbl.headers = headers
+
+                    # Rows as one editable grid; columns are positional so headers can repeat
+                    col_ids = [f"c{c_idx}" for c_idx in range(len(tbl.headers))]
+                    table_rows = render_grid_editor(
+                        f"tbl_rows_{tbl.widget_key}",
+                        [{col_ids[c_idx]: (row[c_idx] if c_idx < len(row) else "") for c_idx in range(len(col_ids))}
+                         for row in tbl.rows],
+                        col_ids,
+                        column_config={col_ids[c_idx]: st.column_config.TextColumn(header or f"Col {c_idx+1}")
+                                       for c_idx, header in enumerate(tbl.headers)},
+                    )
+                    tbl.rows = [[row[col_id] for col_id in col_ids] for row in table_rows]
+
+                    if st.button("Delete Table", key=f"del_tbl_{tbl.widget_key}"):
+                        concept.tables.pop(tbl_idx)
+                        note_edit()
+                        st.rerun(scope="fragment")
+
+                    st.divider()
+
+            if st.button("➕ Add Table", key=f"add_tbl_{concept.widget_key}"):
+                concept.tables.append(ConceptTable())
+                note_edit()
+                st.rerun(scope="fragment")
+
+        # --- Extras Tab ---
+        with tab_extras:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("**🧠 Memory Trick**")
+                st.text_area("Mnemonic/Trick", height=100,
+                             placeholder="FLAT-CUN — Flag, Language, Assembly...",
+                             **bind_widget(f"concept_trick_{concept.widget_key}", concept, "memory_trick",
+                                           empty_as_none=True))
+
+            with col2:
+                st.markdown("**💡 Did You Know?**")
+                st.text_area("Interesting Fact", height=100, placeholder="Interesting fact...",
+                             **bind_widget(f"concept_dyk_{concept.widget_key}", concept, "did_you_know",
+                                           empty_as_none=True))
+
+            st.divider()
+            st.markdown("**🎨 Custom Colored Boxes**")
+
+            for box_idx, box in enumerate(concept.custom_boxes):
+                with st.container():
+                    c1, c2, c3 = st.columns([3, 2, 1])
+                    with c1:
+                        st.text_input("Box Title", placeholder="e.g., Important Note",
+                                      **bind_widget(f"box_title_{box.widget_key}", box, "title"))
+                    with c2:
+                        color_name = BOX_COLOR_NAME_BY_HEX.get(box.background_color, "Light Grey")
+                        if f"box_color_{box.widget_key}" not in st.session_state:
+                            st.session_state[f"box_color_{box.widget_key}"] = color_name
+                        selected = st.selectbox("Color", BOX_COLOR_NAMES,
+                                               key=f"box_color_{box.widget_key}")
+                        box.background_color = BOX_COLOR_OPTIONS[selected]
+                    with c3:
+                        if st.button("🗑️", key=f"del_box_{box.widget_key}"):
+                            concept.custom_boxes.pop(box_idx)
+                            note_edit()
+                            st.rerun(scope="fragment")
+
+                    st.text_area("Box Content", height=80,
+                                 **bind_widget(f"box_content_{box.widget_key}", box, "content"))
+                    st.divider()
+
+            if st.button("➕ Add Colored Box", key=f"add_box_{concept.widget_key}"):
+                concept.custom_boxes.append(CustomBox())
+                note_edit()
+                st.rerun(scope="fragment")
+
+    # Commit here too: a fragment rerun never reaches the page's commit
+    SessionManager.set_chapter_data(data)
+
+
 def render_part_c():
     """Render Part C: Model Answers editor."""
     st.title("✅ Part C: Model Answers")
@@ -848,45 +1035,12 @@ def render_part_c():
     with col_btn:
         if st.button("➕ Add Answer", type="primary", use_container_width=True):
             data.model_answers.append(ModelAnswer())
-            st.rerun()
+            note_edit()
     
     st.markdown("<br>", unsafe_allow_html=True)
 
     for idx, answer in enumerate(data.model_answers):
-        with st.expander(f"Q{idx+1}: {answer.question[:50] or 'New Question'}...", expanded=idx == 0):
-            # Top Row: Question and Meta
-            col1, col2 = st.columns([5, 1])
-            with col1:
-                q = st.text_area("Question", value=answer.question, key=f"ans_q_{idx}", height=70,
-                                placeholder="Enter the question here...")
-                answer.question = q
-            with col2:
-                m = st.number_input("Marks", min_value=1, max_value=10,
-                                   value=answer.marks, key=f"ans_m_{idx}")
-                answer.marks = m
-                
-                if st.button("🗑️", key=f"del_ans_{idx}", use_container_width=True):
-                    data.model_answers.pop(idx)
-                    st.rerun()
-
-            # Content Tabs
-            tab_ans, tab_scheme = st.tabs(["📝 Model Answer", "📋 Marking Scheme"])
-            
-            with tab_ans:
-                st.caption("Write the ideal answer using markdown.")
-                # Toolbar targets the text area below
-                render_markdown_toolbar(f"ans_a_{idx}")
-                ans = st.text_area("Answer", value=answer.answer,
-                                  height=200, key=f"ans_a_{idx}", label_visibility="collapsed",
-                                  placeholder="Step-by-step answer...")
-                answer.answer = ans
-            
-            with tab_scheme:
-                st.info("Break down the answer into value points (1 mark each).")
-                points_text = "\n".join(answer.marking_points) if answer.marking_points else ""
-                points = st.text_area("Marking Points (one per line)", value=points_text, height=150,
-                                     key=f"ans_points_{idx}")
-                answer.marking_points = [p.strip() for p in points.split("\n") if p.strip()]
+        render_model_answer_item(data, idx, answer)
 
     # Examiner Tips
     st.divider()
@@ -916,6 +1070,50 @@ def render_part_c():
         st.rerun()
 
 
+@st.fragment
+def render_model_answer_item(data, idx, answer):
+    """Render the editor for one model answer (as a fragment)."""
+    expander = lazy_expander(f"Q{idx+1}: {answer.question[:50] or 'New Question'}...", f"exp_ans_{answer.widget_key}", expanded=idx == 0)
+    with expander:
+        if not expander.open:
+            return
+
+        # Top Row: Question and Meta
+        col1, col2 = st.columns([5, 1])
+        with col1:
+            q = st.text_area("Question", value=answer.question, key=f"ans_q_{answer.widget_key}", height=70,
+                            placeholder="Enter the question here...")
+            answer.question = q
+        with col2:
+            m = st.number_input("Marks", min_value=1, max_value=10,
+                               value=answer.marks, key=f"ans_m_{answer.widget_key}")
+            answer.marks = m
+
+            if st.button("🗑️", key=f"del_ans_{answer.widget_key}", use_container_width=True):
+                data.model_answers.pop(idx)
+                note_edit()
+                st.rerun()
+
+        # Content Tabs
+        tab_ans, tab_scheme = st.tabs(["📝 Model Answer", "📋 Marking Scheme"])
+
+        with tab_ans:
+            st.caption("Write the ideal answer using markdown.")
+            # Toolbar targets the text area below
+            render_markdown_toolbar(f"ans_a_{answer.widget_key}")
+            ans = st.text_area("Answer", value=answer.answer,
+                              height=200, key=f"ans_a_{answer.widget_key}", label_visibility="collapsed",
+                              placeholder="Step-by-step answer...")
+            answer.answer = ans
+
+        with tab_scheme:
+            st.info("Break down the answer into value points (1 mark each).")
+            answer.marking_points = render_lines_text_area(f"ans_points_{answer.widget_key}", answer.marking_points,
+                                                           "Marking Points (one per line)", height=150)
+
+    SessionManager.set_chapter_data(data)
+
+
 def render_part_d():
     """Render Part D: Practice Questions editor."""
     st.title("📝 Part D: Practice Questions")
@@ -934,13 +1132,13 @@ def render_part_d():
         render_ar_editor(data)
 
     with tabs[2]:
-        render_question_list_editor(data.short_answer, "Short Answer (3M)", "sa")
+        render_question_list_editor(data, data.short_answer, "Short Answer (3M)", "sa")
 
     with tabs[3]:
-        render_question_list_editor(data.long_answer, "Long Answer (5M)", "la")
+        render_question_list_editor(data, data.long_answer, "Long Answer (5M)", "la")
 
     with tabs[4]:
-        render_question_list_editor(data.hots, "HOTS", "hots")
+        render_question_list_editor(data, data.hots, "HOTS", "hots")
 
     SessionManager.set_chapter_data(data)
 
@@ -960,8 +1158,18 @@ def render_part_d():
         st.rerun()
 
 
+def delete_list_item(items, idx):
+    """Delete button callback: remove an item before its list fragment reruns."""
+    items.pop(idx)
+    note_edit()
+
+
+@st.fragment
 def render_mcq_editor(data):
-    """Render MCQ editor."""
+    """
+    Render MCQ editor.
+    Runs as a fragment: adding, deleting or editing MCQs only reruns this list.
+    """
     st.subheader("Multiple Choice Questions")
 
     col_head, col_btn = st.columns([4, 1])
@@ -973,54 +1181,61 @@ def render_mcq_editor(data):
                 options=['', '', '', ''],
                 answer='a'
             ))
-            st.rerun()
+            note_edit()
 
     for idx, mcq in enumerate(data.mcqs):
-        with st.expander(f"MCQ {idx+1}: {mcq.question[:40] or 'New'}...", expanded=idx == 0):
-            # Question Row
-            col1, col2, col3 = st.columns([4, 1, 1])
-            with col1:
-                q = st.text_input("Question", value=mcq.question, key=f"mcq_q_{idx}")
-                mcq.question = q
-            with col2:
-                d = st.selectbox("Diff", ["E", "M", "H"],
-                                index=["E", "M", "H"].index(mcq.difficulty) if mcq.difficulty in ["E", "M", "H"] else 1,
-                                key=f"mcq_d_{idx}", label_visibility="collapsed")
-                mcq.difficulty = d
-            with col3:
-                if st.button("🗑️", key=f"del_mcq_{idx}"):
-                    data.mcqs.pop(idx)
-                    st.rerun()
+        render_mcq_item(data, idx, mcq)
 
-            # Options Grid
-            st.caption("Options")
-            options = mcq.options or ['', '', '', '']
-            
-            with st.container(border=True):
-                opt_col1, opt_col2 = st.columns(2)
-                for i in range(4):
-                    col = opt_col1 if i < 2 else opt_col2
-                    with col:
-                        opt = st.text_input(f"Option ({chr(97+i)})", value=options[i] if i < len(options) else "",
-                                           key=f"mcq_opt_{idx}_{i}")
-                        if len(options) > i:
-                            options[i] = opt
-            mcq.options = options
-
-            # Answer
-            st.markdown(f"**Correct Answer:**")
-            ans_cols = st.columns(4)
-            current_ans = mcq.answer if mcq.answer in ['a', 'b', 'c', 'd'] else 'a'
-            
-            # Custom radio style using columns
-            for i, opt_char in enumerate(['a', 'b', 'c', 'd']):
-                with ans_cols[i]:
-                    if st.checkbox(f"Option {opt_char}", value=(current_ans == opt_char), key=f"mcq_ans_chk_{idx}_{i}"):
-                        mcq.answer = opt_char
+    SessionManager.set_chapter_data(data)
 
 
+def render_mcq_item(data, idx, mcq):
+    """Render the editor for one MCQ."""
+    expander = lazy_expander(f"MCQ {idx+1}: {mcq.question[:40] or 'New'}...", f"exp_mcq_{mcq.widget_key}", expanded=idx == 0)
+    with expander:
+        if not expander.open:
+            return
+
+        # Question Row
+        col1, col2, col3 = st.columns([4, 1, 1])
+        with col1:
+            q = st.text_input("Question", value=mcq.question, key=f"mcq_q_{mcq.widget_key}")
+            mcq.question = q
+        with col2:
+            d = st.selectbox("Diff", DIFFICULTY_OPTIONS,
+                            index=DIFFICULTY_INDEX.get(mcq.difficulty, 1),
+                            key=f"mcq_d_{mcq.widget_key}", label_visibility="collapsed")
+            mcq.difficulty = d
+        with col3:
+            st.button("🗑️", key=f"del_mcq_{mcq.widget_key}", on_click=delete_list_item, args=(data.mcqs, idx))
+
+        # Options Grid
+        st.caption("Options")
+        options = list(mcq.options or ['', '', '', ''])
+
+        with st.container(border=True):
+            opt_col1, opt_col2 = st.columns(2)
+            for i in range(4):
+                col = opt_col1 if i < 2 else opt_col2
+                with col:
+                    opt = st.text_input(MCQ_OPTION_LABELS[i], value=options[i] if i < len(options) else "",
+                                       key=f"mcq_opt_{mcq.widget_key}_{i}")
+                    if len(options) > i:
+                        options[i] = opt
+        mcq.options = options
+
+        # Answer
+        st.markdown(f"**Correct Answer:**")
+        mcq.answer = st.radio("Correct Answer", ANSWER_OPTIONS,
+                              index=ANSWER_INDEX.get(mcq.answer, 0),
+                              format_func=lambda opt_char: f"Option {opt_char}",
+                              key=f"mcq_ans_{mcq.widget_key}",
+                              horizontal=True, label_visibility="collapsed")
+
+
+@st.fragment
 def render_ar_editor(data):
-    """Render Assertion-Reason editor."""
+    """Render Assertion-Reason editor (as a fragment, like the MCQ editor)."""
     st.subheader("Assertion-Reason Questions")
 
     col_head, col_btn = st.columns([4, 1])
@@ -1031,59 +1246,78 @@ def render_ar_editor(data):
                 difficulty='M',
                 answer='a'
             ))
-            st.rerun()
+            note_edit()
 
     for idx, ar in enumerate(data.assertion_reason):
-        with st.expander(f"A-R {idx+1}", expanded=idx == 0):
-            col1, col2 = st.columns([5, 1])
+        render_ar_item(data, idx, ar)
 
-            with col1:
-                render_markdown_toolbar(f"tb_ar_{idx}")
-                q = st.text_area("Assertion and Reason",
-                                value=ar.question,
-                                placeholder="Assertion: ...\nReason: ...",
-                                key=f"ar_q_{idx}", height=100)
-                ar.question = q
+    SessionManager.set_chapter_data(data)
 
-            with col2:
-                if st.button("🗑️", key=f"del_ar_{idx}"):
-                    data.assertion_reason.pop(idx)
-                    st.rerun()
 
-            st.write("Correct Answer:")
-            st.caption("a) Both A and R are true and R is correct explanation...")
-            ans = st.selectbox("Select Option", ['a', 'b', 'c', 'd'],
-                              index=['a', 'b', 'c', 'd'].index(ar.answer) if ar.answer in ['a', 'b', 'c', 'd'] else 0,
-                              key=f"ar_ans_{idx}")
-            ar.answer = ans
+def render_ar_item(data, idx, ar):
+    """Render the editor for one assertion-reason question."""
+    expander = lazy_expander(f"A-R {idx+1}", f"exp_ar_{ar.widget_key}", expanded=idx == 0)
+    with expander:
+        if not expander.open:
+            return
+
+        col1, col2 = st.columns([5, 1])
+
+        with col1:
+            render_markdown_toolbar(f"tb_ar_{ar.widget_key}")
+            q = st.text_area("Assertion and Reason",
+                            value=ar.question,
+                            placeholder="Assertion: ...\nReason: ...",
+                            key=f"ar_q_{ar.widget_key}", height=100)
+            ar.question = q
+
+        with col2:
+            st.button("🗑️", key=f"del_ar_{ar.widget_key}", on_click=delete_list_item, args=(data.assertion_reason, idx))
+
+        st.write("Correct Answer:")
+        st.caption("a) Both A and R are true and R is correct explanation...")
+        ans = st.selectbox("Select Option", ANSWER_OPTIONS,
+                          index=ANSWER_INDEX.get(ar.answer, 0),
+                          key=f"ar_ans_{ar.widget_key}")
+        ar.answer = ans
 
 
-def render_question_list_editor(questions, title, prefix):
-    """Render a generic question list editor."""
+@st.fragment
+def render_question_list_editor(data, questions, title, prefix):
+    """Render a generic question list editor (as a fragment, like the MCQ editor)."""
     col_h, col_b = st.columns([4, 1])
     with col_h:
         st.subheader(title)
     with col_b:
         if st.button(f"➕ Add", key=f"add_{prefix}", use_container_width=True):
             questions.append(QuestionItem(marks=3 if 'Short' in title else 5))
-            st.rerun()
+            note_edit()
 
     for idx, q in enumerate(questions):
-        with st.expander(f"{idx+1}. {q.question[:40] or 'New'}...", expanded=idx == 0):
-            col1, col2 = st.columns([5, 1])
+        render_question_item(questions, idx, q, prefix)
 
-            with col1:
-                render_markdown_toolbar(f"{prefix}_q_{idx}")
-                question = st.text_area("Question", value=q.question, key=f"{prefix}_q_{idx}", height=100)
-                q.question = question
+    SessionManager.set_chapter_data(data)
 
-            with col2:
-                if st.button("🗑️", key=f"del_{prefix}_{idx}"):
-                    questions.pop(idx)
-                    st.rerun()
 
-            hint = st.text_input("💡 Hint / Key Value Points (optional)", value=q.hint or "", key=f"{prefix}_h_{idx}")
-            q.hint = hint if hint else None
+def render_question_item(questions, idx, q, prefix):
+    """Render the editor for one question in a generic list."""
+    expander = lazy_expander(f"{idx+1}. {q.question[:40] or 'New'}...", f"exp_{prefix}_{q.widget_key}", expanded=idx == 0)
+    with expander:
+        if not expander.open:
+            return
+
+        col1, col2 = st.columns([5, 1])
+
+        with col1:
+            render_markdown_toolbar(f"{prefix}_q_{q.widget_key}")
+            question = st.text_area("Question", value=q.question, key=f"{prefix}_q_{q.widget_key}", height=100)
+            q.question = question
+
+        with col2:
+            st.button("🗑️", key=f"del_{prefix}_{q.widget_key}", on_click=delete_list_item, args=(questions, idx))
+
+        hint = st.text_input("💡 Hint / Key Value Points (optional)", value=q.hint or "", key=f"{prefix}_h_{q.widget_key}")
+        q.hint = hint if hint else None
 
 
 def render_part_e():
@@ -1106,10 +1340,8 @@ def render_part_e():
         st.subheader("📍 Map Locations")
         st.caption("Enter each location on a new line")
 
-        items_text = "\n".join(data.map_items) if data.map_items else ""
-        items = st.text_area("Map Items", value=items_text, height=200,
-                            placeholder="Location 1\nLocation 2\n...")
-        data.map_items = [i.strip() for i in items.split("\n") if i.strip()]
+        data.map_items = render_lines_text_area("map_items", data.map_items, "Map Items", height=200,
+                                                placeholder="Location 1\nLocation 2\n...")
 
         # Map tips
         st.subheader("💡 Map Marking Tips")
@@ -1135,6 +1367,17 @@ def render_part_e():
         st.rerun()
 
 
+@st.fragment
+def render_row_grid(data, attr, key, columns, column_config):
+    """
+    Edit a list-of-dicts chapter field (key terms, time allocation, ...) as a grid.
+    Runs as a fragment: a cell edit only reruns the grid, not the whole page.
+    """
+    rows = [{col: item.get(col, '') for col in columns} for item in getattr(data, attr)]
+    setattr(data, attr, render_grid_editor(key, rows, columns, column_config=column_config))
+    SessionManager.set_chapter_data(data)
+
+
 def render_part_f():
     """Render Part F: Quick Revision editor."""
     st.title("🔄 Part F: Quick Revision")
@@ -1150,34 +1393,22 @@ def render_part_f():
         st.caption("One point per line. Use **bold** for keywords.")
         render_markdown_toolbar("key_points")
         
-        points_text = "\n".join(data.revision_key_points) if data.revision_key_points else ""
-        points = st.text_area("Key Points", value=points_text, height=200, key="key_points", label_visibility="collapsed")
-        data.revision_key_points = [p.strip() for p in points.split("\n") if p.strip()]
+        data.revision_key_points = render_lines_text_area("key_points", data.revision_key_points, "Key Points",
+                                                          height=200, label_visibility="collapsed")
 
     st.divider()
 
     # Key Terms
     st.subheader("📖 Key Terms")
     
-    col_h, col_b = st.columns([4, 1])
-    with col_b:
-        if st.button("➕ Add Term", key="add_term", use_container_width=True):
-            data.revision_key_terms.append({'term': '', 'definition': ''})
-            st.rerun()
-
-    for idx, item in enumerate(data.revision_key_terms):
-        with st.container(border=True):
-            col1, col2, col3 = st.columns([2, 4, 1])
-            with col1:
-                term = st.text_input("Term", value=item.get('term', ''), key=f"term_{idx}", placeholder="Term")
-                item['term'] = term
-            with col2:
-                definition = st.text_input("Definition", value=item.get('definition', ''), key=f"def_{idx}", placeholder="Definition")
-                item['definition'] = definition
-            with col3:
-                if st.button("🗑️", key=f"del_term_{idx}"):
-                    data.revision_key_terms.pop(idx)
-                    st.rerun()
+    render_row_grid(
+        data, 'revision_key_terms', "key_terms_editor",
+        ['term', 'definition'],
+        column_config={
+            'term': st.column_config.TextColumn("Term", width="small"),
+            'definition': st.column_config.TextColumn("Definition", width="large"),
+        },
+    )
 
     st.divider()
 
@@ -1185,9 +1416,8 @@ def render_part_f():
     with st.container(border=True):
         st.subheader("🧠 Memory Tricks Compilation")
         render_markdown_toolbar("mem_tricks")
-        tricks_text = "\n".join(data.revision_memory_tricks) if data.revision_memory_tricks else ""
-        tricks = st.text_area("Memory Tricks", value=tricks_text, height=150, key="mem_tricks", label_visibility="collapsed")
-        data.revision_memory_tricks = [t.strip() for t in tricks.split("\n") if t.strip()]
+        data.revision_memory_tricks = render_lines_text_area("mem_tricks", data.revision_memory_tricks, "Memory Tricks",
+                                                             height=150, label_visibility="collapsed")
 
     SessionManager.set_chapter_data(data)
 
@@ -1219,61 +1449,29 @@ def render_part_g():
     # Time Allocation
     st.subheader("⏱️ Time Allocation")
 
-    col_h, col_b = st.columns([4, 1])
-    with col_b:
-        if st.button("➕ Add Row", key="add_time", use_container_width=True):
-            data.time_allocation.append({'type': '', 'marks': '', 'time': ''})
-            st.rerun()
-
-    if data.time_allocation:
-        with st.container(border=True):
-            # Header Row
-            h1, h2, h3, h4 = st.columns([3, 1, 2, 0.5])
-            h1.markdown("**Question Type**")
-            h2.markdown("**Marks**")
-            h3.markdown("**Time (mins)**")
-            
-            for idx, item in enumerate(data.time_allocation):
-                col1, col2, col3, col4 = st.columns([3, 1, 2, 0.5])
-
-                with col1:
-                    t = st.text_input("Type", value=item.get('type', ''), key=f"time_type_{idx}", label_visibility="collapsed")
-                    item['type'] = t
-                with col2:
-                    m = st.text_input("Marks", value=item.get('marks', ''), key=f"time_marks_{idx}", label_visibility="collapsed")
-                    item['marks'] = m
-                with col3:
-                    time = st.text_input("Time", value=item.get('time', ''), key=f"time_time_{idx}", label_visibility="collapsed")
-                    item['time'] = time
-                with col4:
-                    if st.button("🗑️", key=f"del_time_{idx}"):
-                        data.time_allocation.pop(idx)
-                        st.rerun()
+    render_row_grid(
+        data, 'time_allocation', "time_allocation_editor",
+        ['type', 'marks', 'time'],
+        column_config={
+            'type': st.column_config.TextColumn("Question Type", width="large"),
+            'marks': st.column_config.TextColumn("Marks", width="small"),
+            'time': st.column_config.TextColumn("Time (mins)", width="medium"),
+        },
+    )
 
     st.divider()
 
     # Common Mistakes
     st.subheader("❌ What Loses Marks")
     
-    col_h, col_b = st.columns([4, 1])
-    with col_b:
-        if st.button("➕ Add Mistake", key="add_mistake", use_container_width=True):
-            data.common_mistakes_exam.append({'mistake': '', 'correction': ''})
-            st.rerun()
-
-    for idx, item in enumerate(data.common_mistakes_exam):
-        with st.container(border=True):
-            col1, col2, col3 = st.columns([3, 3, 0.5])
-            with col1:
-                m = st.text_input("Mistake", value=item.get('mistake', ''), key=f"mistake_{idx}", placeholder="Common Mistake")
-                item['mistake'] = m
-            with col2:
-                c = st.text_input("Correction", value=item.get('correction', ''), key=f"correction_{idx}", placeholder="What to do instead")
-                item['correction'] = c
-            with col3:
-                if st.button("🗑️", key=f"del_mistake_{idx}"):
-                    data.common_mistakes_exam.pop(idx)
-                    st.rerun()
+    render_row_grid(
+        data, 'common_mistakes_exam', "mistakes_editor",
+        ['mistake', 'correction'],
+        column_config={
+            'mistake': st.column_config.TextColumn("Common Mistake"),
+            'correction': st.column_config.TextColumn("What to do instead"),
+        },
+    )
 
     st.divider()
 
@@ -1281,9 +1479,8 @@ def render_part_g():
     with st.container(border=True):
         st.subheader("✅ Examiner's Pro Tips")
         render_markdown_toolbar("pro_tips")
-        tips_text = "\n".join(data.examiner_pro_tips) if data.examiner_pro_tips else ""
-        tips = st.text_area("Pro Tips (one per line)", value=tips_text, height=150, key="pro_tips", label_visibility="collapsed")
-        data.examiner_pro_tips = [t.strip() for t in tips.split("\n") if t.strip()]
+        data.examiner_pro_tips = render_lines_text_area("pro_tips", data.examiner_pro_tips, "Pro Tips (one per line)",
+                                                        height=150, label_visibility="collapsed")
 
     st.divider()
 
@@ -1291,9 +1488,9 @@ def render_part_g():
     with st.container(border=True):
         st.subheader("☑️ Self-Assessment Checklist")
         render_markdown_toolbar("checklist")
-        checklist_text = "\n".join(data.self_assessment_checklist) if data.self_assessment_checklist else ""
-        checklist = st.text_area("Checklist Items (one per line)", value=checklist_text, height=150, key="checklist", label_visibility="collapsed")
-        data.self_assessment_checklist = [c.strip() for c in checklist.split("\n") if c.strip()]
+        data.self_assessment_checklist = render_lines_text_area("checklist", data.self_assessment_checklist,
+                                                                "Checklist Items (one per line)",
+                                                                height=150, label_visibility="collapsed")
 
     SessionManager.set_chapter_data(data)
 
@@ -1313,6 +1510,35 @@ def render_part_g():
         st.rerun()
 
 
+def render_add_part_form(data, part_manager, parts):
+    """Render the Add Custom Part inputs."""
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        # Get next available ID
+        existing_ids = {p.id for p in parts}
+        next_id = next((letter for letter in 'HIJKLMNOP' if letter not in existing_ids), 'H')
+
+        new_part_id = st.text_input("Part ID", value=next_id, max_chars=1, key="new_part_id")
+
+    with col2:
+        new_part_name = st.text_input("Part Name", placeholder="e.g., Case Studies", key="new_part_name")
+
+    if st.button("Add Part", type="primary", key="add_new_part"):
+        if new_part_name and new_part_id:
+            if new_part_id.upper() in existing_ids:
+                st.error(f"Part {new_part_id.upper()} already exists!")
+            else:
+                part_manager.add_custom_part(new_part_id.upper(), new_part_name)
+                data.part_descriptions[new_part_id.upper()] = new_part_name
+                note_edit()
+                SessionManager.set_part_manager(part_manager)
+                st.toast(f"Added Part {new_part_id.upper()}: {new_part_name}", icon="✅")
+                st.rerun()
+        else:
+            st.error("Please enter both Part ID and Name")
+
+
 def render_generate_page():
     """Render the document generation page."""
     st.title("⚙️ Generate Document")
@@ -1349,18 +1575,16 @@ def render_generate_page():
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        page_size = st.selectbox("Page Size", ["A4", "A5", "Letter", "Legal"],
-                                index=["A4", "A5", "Letter", "Legal"].index(data.page_size),
-                                key="page_size")
-        data.page_size = page_size
+        # Also set from the sidebar Page Setup, so both stay synced to the chapter
+        st.selectbox("Page Size", PAGE_SIZE_OPTIONS, **bind_widget("page_size", data, "page_size", sync=True))
 
     with col2:
-        add_numbers = st.checkbox("Add Page Numbers", value=data.add_page_numbers, key="page_numbers")
-        data.add_page_numbers = add_numbers
+        st.checkbox("Add Page Numbers", **bind_widget("page_numbers", data, "add_page_numbers", sync=True))
 
     with col3:
         position = st.selectbox("Page Number Position",
-                               ["Bottom Center", "Bottom Right", "Bottom Left"],
+                               PAGE_NUMBER_POSITION_OPTIONS,
+                               index=PAGE_NUMBER_POSITION_INDEX.get(data.page_number_position, 0),
                                key="page_position")
         data.page_number_position = position
 
@@ -1372,6 +1596,7 @@ def render_generate_page():
     parts = part_manager.get_all_parts()
 
     # Display parts in a table-like format
+    parts_changed = False
     for part in parts:
         col1, col2, col3, col4 = st.columns([0.5, 2, 1, 0.5])
 
@@ -1387,6 +1612,7 @@ def render_generate_page():
                     part_manager.enable_part(part.id)
                 else:
                     part_manager.disable_part(part.id)
+                parts_changed = True
 
         with col2:
             st.write(f"**Part {part.id}:** {part.name}")
@@ -1404,38 +1630,18 @@ def render_generate_page():
                     # Also remove from part_descriptions
                     if part.id in data.part_descriptions:
                         del data.part_descriptions[part.id]
+                        note_edit()
+                    SessionManager.set_part_manager(part_manager)
                     st.rerun()
 
+    # Apply all enable/disable toggles in one update
+    if parts_changed:
+        SessionManager.set_part_manager(part_manager)
+
     # Add new part section
     st.divider()
     with st.expander("➕ Add Custom Part"):
-        col1, col2 = st.columns([1, 2])
-
-        with col1:
-            # Get next available ID
-            existing_ids = [p.id for p in parts]
-            next_id = 'H'
-            for letter in 'HIJKLMNOP':
-                if letter not in existing_ids:
-                    next_id = letter
-                    break
-
-            new_part_id = st.text_input("Part ID", value=next_id, max_chars=1, key="new_part_id")
-
-        with col2:
-            new_part_name = st.text_input("Part Name", placeholder="e.g., Case Studies", key="new_part_name")
-
-        if st.button("Add Part", type="primary", key="add_new_part"):
-            if new_part_name and new_part_id:
-                if new_part_id.upper() in existing_ids:
-                    st.error(f"Part {new_part_id.upper()} already exists!")
-                else:
-                    part_manager.add_custom_part(new_part_id.upper(), new_part_name)
-                    data.part_descriptions[new_part_id.upper()] = new_part_name
-                    st.success(f"Added Part {new_part_id.upper()}: {new_part_name}")
-                    st.rerun()
-            else:
-                st.error("Please enter both Part ID and Name")
+        render_add_part_form(data, part_manager, parts)
 
     st.divider()
 
@@ -1446,8 +1652,9 @@ def render_generate_page():
             save_chapter()
             st.success("Project saved!")
 
+    # Part changes are committed where they happen (toggle/add/remove above);
+    # re-setting the manager here would bump the data revision every rerun
     SessionManager.set_chapter_data(data)
-    SessionManager.set_part_manager(part_manager)
 
     # PDF Preview & Download Section
     st.divider()
@@ -1455,6 +1662,138 @@ def render_generate_page():
     show_pdf_preview(data, part_manager)
 
 
+def render_import_summary(summary, count_labels, content_heading):
+    """
+    Show an import preview: chapter/title/subject/class and content counts.
+    Each block is one markdown element (lines joined with hard breaks).
+    """
+    subject = summary.get('subject')
+    st.markdown("**Preview:**")
+    preview_cols = st.columns(2)
+    with preview_cols[0]:
+        st.markdown(f"**Chapter:** {summary.get('chapter_number', '?')}  \n"
+                    f"**Title:** {summary.get('chapter_title', 'Untitled')}")
+    with preview_cols[1]:
+        st.markdown(f"**Subject:** {subject.title() if subject else '?'}  \n"
+                    f"**Class:** {summary.get('class_num', '?')}")
+
+    content_info = [f"{count} {label}" for k, label in count_labels if (count := summary.get(k))]
+    if content_info:
+        st.markdown(f"**{content_heading}**  \n" + ", ".join(content_info))
+
+
+def render_json_import(uploaded, file_type):
+    """Preview a JSON upload (parsed and validated once) and confirm the import."""
+    # Parse/validate once per uploaded file; reruns and the
+    # confirm step reuse the parsed dict
+    pending = st.session_state.get('_pending_import')
+    if pending is None or pending[0] != uploaded.file_id:
+        pending = (uploaded.file_id,
+                   SessionManager.import_from_json(uploaded.getvalue(), show_preview=True))
+        st.session_state['_pending_import'] = pending
+    preview_result = pending[1]
+
+    if preview_result['success']:
+        st.success("✅ File validated successfully!")
+
+        # Show preview summary
+        summary = preview_result.get('summary', {})
+        if summary:
+            render_import_summary(summary, JSON_IMPORT_COUNT_LABELS, "Content:")
+
+        # Confirm import button
+        if st.button("Confirm Import", type="primary", use_container_width=True):
+            result = SessionManager.import_from_json(preview_result['data'])
+
+            if result['success']:
+                del st.session_state['_pending_import']
+                st.success("✅ Imported successfully!")
+                if result.get('warnings'):
+                    # A toast survives the rerun below; inline warnings wouldn't
+                    st.toast("\n".join(result['warnings']), icon="⚠️")
+                st.session_state.current_page = 'cover'
+                st.rerun()
+            else:
+                st.error("Import failed:\n"
+                         + "\n".join(f"- {error}" for error in result.get('errors', ['Unknown error'])))
+    else:
+        # Show validation errors
+        st.error("File validation failed:\n"
+                 + "\n".join(f"- {error}" for error in preview_result.get('errors', ['Unknown error'])))
+
+
+def render_markdown_import(uploaded, file_type):
+    """Preview a Markdown upload (parsed once) and confirm the import."""
+    from core.parsers import MarkdownParser
+
+    # Parse once per uploaded file, like the JSON preview
+    pending = st.session_state.get('_pending_import')
+    if pending is None or pending[0] != uploaded.file_id:
+        pending = (uploaded.file_id, parse_uploaded_document(uploaded, file_type))
+        st.session_state['_pending_import'] = pending
+    chapter_data = pending[1]
+
+    if chapter_data:
+        # Show preview summary
+        summary = MarkdownParser.get_import_summary(chapter_data)
+        st.success("✅ Markdown parsed successfully!")
+
+        render_import_summary(summary, MD_IMPORT_COUNT_LABELS, "Content found:")
+
+        if st.button("Confirm Import", type="primary", use_container_width=True, key="md_import"):
+            del st.session_state['_pending_import']
+            SessionManager.set_chapter_data(chapter_data)
+            st.success("✅ Imported from Markdown!")
+            st.session_state.current_page = 'cover'
+            st.rerun()
+    else:
+        st.error("Failed to parse Markdown file. Check the format and try again.")
+
+
+def render_document_import(uploaded, file_type):
+    """Import basic metadata from a DOCX or PDF upload."""
+    if st.button("Import", type="primary", use_container_width=True):
+        try:
+            from core.parsers import PdfParser
+
+            chapter_data = parse_uploaded_document(uploaded, file_type)
+
+            if chapter_data:
+                SessionManager.set_chapter_data(chapter_data)
+
+                # Show what was extracted
+                st.success(f"✅ Imported from {file_type.upper()}!")
+
+                extracted = [f"{label}: {fmt(value)}" for attr, label, fmt in DOC_IMPORT_FIELDS
+                             if (value := getattr(chapter_data, attr))]
+
+                if extracted:
+                    st.info("**Extracted:** " + " | ".join(extracted))
+
+                st.warning("Note: Only basic metadata extracted from DOCX/PDF. Fill in remaining sections manually.")
+                st.session_state.current_page = 'cover'
+                st.rerun()
+            else:
+                # Check if failure was due to missing PDF dependencies
+                if file_type == 'pdf' and PdfParser.was_missing_deps():
+                    st.warning(PdfParser.get_missing_dependency_message())
+                st.error(f"Failed to parse {file_type.upper()} file. The document format may not be recognized.")
+
+        except Exception as e:
+            st.error(f"Import error: {str(e)}")
+
+
+# Upload file type -> import renderer (DOCX/PDF share one); one entry per
+# ALLOWED_EXTENSIONS type, which validate_uploaded_file checks before lookup
+IMPORT_RENDERERS = {
+    'json': render_json_import,
+    'md': render_markdown_import,
+    'markdown': render_markdown_import,
+    'docx': render_document_import,
+    'pdf': render_document_import,
+}
+
+
 def render_import_export():
     """Render import/export page."""
     st.title("📥 Import / Export")
@@ -1466,17 +1805,16 @@ def render_import_export():
 
         data = SessionManager.get_chapter_data()
         if data:
-            # Export as JSON
-            json_str = SessionManager.export_to_json()
-            if json_str:
-                filename = f"Ch{data.chapter_number}_{data.subject}_data.json"
-                st.download_button(
-                    label="⬇️ Export as JSON",
-                    data=json_str,
-                    file_name=filename,
-                    mime="application/json",
-                    use_container_width=True
-                )
+            # Export as JSON (serialized only when the button is clicked)
+            part_manager = SessionManager.get_part_manager()
+            filename = f"Ch{data.chapter_number}_{data.subject}_data.json"
+            st.download_button(
+                label="⬇️ Export as JSON",
+                data=lambda: SessionManager.serialize_export(data, part_manager),
+                file_name=filename,
+                mime="application/json",
+                use_container_width=True
+            )
         else:
             st.info("No chapter loaded to export")
 
@@ -1486,170 +1824,22 @@ def render_import_export():
         # Accept JSON, DOCX, PDF, and Markdown files
         uploaded = st.file_uploader(
             "Upload file",
-            type=['json', 'docx', 'pdf', 'md'],
+            type=sorted(ALLOWED_EXTENSIONS),
             help="Import from JSON (full data), Markdown (structured), DOCX, or PDF"
         )
 
         if uploaded:
-            # Validate file before processing
-            is_valid, error_msg = validate_uploaded_file(uploaded)
+            # Validate file before processing (once per uploaded file)
+            check = st.session_state.get('_upload_check')
+            if check is None or check[0] != uploaded.file_id:
+                check = (uploaded.file_id, validate_uploaded_file(uploaded))
+                st.session_state['_upload_check'] = check
+            is_valid, error_msg = check[1]
             if not is_valid:
                 st.error(error_msg)
             else:
                 file_type = uploaded.name.split('.')[-1].lower()
-
-                # Show preview first for JSON files
-                if file_type == 'json':
-                    content = uploaded.read().decode('utf-8')
-                    uploaded.seek(0)  # Reset file pointer for later import
-
-                    # Preview the data
-                    preview_result = SessionManager.import_from_json(content, show_preview=True)
-
-                    if preview_result['success']:
-                        st.success("✅ File validated successfully!")
-
-                        # Show preview summary
-                        summary = preview_result.get('summary', {})
-                        if summary:
-                            st.markdown("**Preview:**")
-                            preview_cols = st.columns(2)
-                            with preview_cols[0]:
-                                st.write(f"**Chapter:** {summary.get('chapter_number', '?')}")
-                                st.write(f"**Title:** {summary.get('chapter_title', 'Untitled')}")
-                            with preview_cols[1]:
-                                st.write(f"**Subject:** {summary.get('subject', '?').title()}")
-                                st.write(f"**Class:** {summary.get('class_num', '?')}")
-
-                            # Show content counts
-                            if any([summary.get('concepts_count'), summary.get('pyq_count'),
-                                    summary.get('mcq_count'), summary.get('model_answers_count')]):
-                                st.markdown("**Content:**")
-                                content_info = []
-                                if summary.get('concepts_count'):
-                                    content_info.append(f"{summary['concepts_count']} concepts")
-                                if summary.get('pyq_count'):
-                                    content_info.append(f"{summary['pyq_count']} PYQs")
-                                if summary.get('mcq_count'):
-                                    content_info.append(f"{summary['mcq_count']} MCQs")
-                                if summary.get('model_answers_count'):
-                                    content_info.append(f"{summary['model_answers_count']} model answers")
-                                st.write(", ".join(content_info))
-
-                        # Confirm import button
-                        if st.button("Confirm Import", type="primary", use_container_width=True):
-                            content = uploaded.read().decode('utf-8')
-                            result = SessionManager.import_from_json(content)
-
-                            if result['success']:
-                                st.success("✅ Imported successfully!")
-                                if result.get('warnings'):
-                                    for warning in result['warnings']:
-                                        st.warning(warning)
-                                st.session_state.current_page = 'cover'
-                                st.rerun()
-                            else:
-                                for error in result.get('errors', ['Unknown error']):
-                                    st.error(f"Import failed: {error}")
-                    else:
-                        # Show validation errors
-                        st.error("File validation failed:")
-                        for error in preview_result.get('errors', ['Unknown error']):
-                            st.error(f"• {error}")
-
-                elif file_type == 'md':
-                    # Markdown import with preview
-                    from core.parsers import MarkdownParser, parse_document
-
-                    file_bytes = uploaded.read()
-                    uploaded.seek(0)
-
-                    chapter_data = parse_document(file_bytes, file_type)
-
-                    if chapter_data:
-                        # Show preview summary
-                        summary = MarkdownParser.get_import_summary(chapter_data)
-                        st.success("✅ Markdown parsed successfully!")
-
-                        st.markdown("**Preview:**")
-                        preview_cols = st.columns(2)
-                        with preview_cols[0]:
-                            st.write(f"**Chapter:** {summary.get('chapter_number', '?')}")
-                            st.write(f"**Title:** {summary.get('chapter_title', 'Untitled')}")
-                        with preview_cols[1]:
-                            st.write(f"**Subject:** {summary.get('subject', '?').title() if summary.get('subject') else '?'}")
-                            st.write(f"**Class:** {summary.get('class_num', '?')}")
-
-                        # Show content counts
-                        content_info = []
-                        if summary.get('concepts_count'):
-                            content_info.append(f"{summary['concepts_count']} concepts")
-                        if summary.get('pyq_count'):
-                            content_info.append(f"{summary['pyq_count']} PYQs")
-                        if summary.get('mcq_count'):
-                            content_info.append(f"{summary['mcq_count']} MCQs")
-                        if summary.get('short_answer_count'):
-                            content_info.append(f"{summary['short_answer_count']} short answers")
-                        if summary.get('long_answer_count'):
-                            content_info.append(f"{summary['long_answer_count']} long answers")
-                        if summary.get('key_points_count'):
-                            content_info.append(f"{summary['key_points_count']} key points")
-                        if summary.get('key_terms_count'):
-                            content_info.append(f"{summary['key_terms_count']} key terms")
-
-                        if content_info:
-                            st.markdown("**Content found:**")
-                            st.write(", ".join(content_info))
-
-                        if st.button("Confirm Import", type="primary", use_container_width=True, key="md_import"):
-                            SessionManager.set_chapter_data(chapter_data)
-                            st.success("✅ Imported from Markdown!")
-                            st.session_state.current_page = 'cover'
-                            st.rerun()
-                    else:
-                        st.error("Failed to parse Markdown file. Check the format and try again.")
-
-                else:
-                    # DOCX or PDF import
-                    if st.button("Import", type="primary", use_container_width=True):
-                        try:
-                            from core.parsers import parse_document, PdfParser
-
-                            file_bytes = uploaded.read()
-                            chapter_data = parse_document(file_bytes, file_type)
-
-                            if chapter_data:
-                                SessionManager.set_chapter_data(chapter_data)
-
-                                # Show what was extracted
-                                st.success(f"✅ Imported from {file_type.upper()}!")
-
-                                extracted = []
-                                if chapter_data.chapter_title:
-                                    extracted.append(f"Title: {chapter_data.chapter_title}")
-                                if chapter_data.chapter_number:
-                                    extracted.append(f"Chapter: {chapter_data.chapter_number}")
-                                if chapter_data.subject:
-                                    extracted.append(f"Subject: {chapter_data.subject.title()}")
-                                if chapter_data.weightage:
-                                    extracted.append(f"Weightage: {chapter_data.weightage}")
-                                if chapter_data.importance:
-                                    extracted.append(f"Importance: {chapter_data.importance}")
-
-                                if extracted:
-                                    st.info("**Extracted:** " + " | ".join(extracted))
-
-                                st.warning("Note: Only basic metadata extracted from DOCX/PDF. Fill in remaining sections manually.")
-                                st.session_state.current_page = 'cover'
-                                st.rerun()
-                            else:
-                                # Check if failure was due to missing PDF dependencies
-                                if file_type == 'pdf' and PdfParser.was_missing_deps():
-                                    st.warning(PdfParser.get_missing_dependency_message())
-                                st.error(f"Failed to parse {file_type.upper()} file. The document format may not be recognized.")
-
-                        except Exception as e:
-                            st.error(f"Import error: {str(e)}")
+                IMPORT_RENDERERS[file_type](uploaded, file_type)
 
         # Help text
         st.caption("""
@@ -1666,15 +1856,47 @@ def save_chapter():
     if not data:
         return
 
-    json_str = SessionManager.export_to_json()
-    if json_str:
-        filename = f"class_{data.class_num}_{data.subject}_ch{data.chapter_number:02d}.json"
-        filepath = AUTOSAVE_DIR / filename
+    filename = f"class_{data.class_num}_{data.subject}_ch{data.chapter_number:02d}.json"
+    filepath = AUTOSAVE_DIR / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(json_str)
+    # Skip the write only if the content matches what this session last wrote
+    # and that file is still on disk unchanged. The dirty flag isn't enough:
+    # some edits reach `data` before (or without) a set_chapter_data commit.
+    fingerprint = SessionManager.content_fingerprint(data)
+    if (fingerprint == SessionManager.get_saved_fingerprint()
+            and st.session_state.get('_saved_file') == _file_stamp(filepath)):
+        SessionManager.mark_clean(fingerprint)
+        return
 
-        SessionManager.mark_clean()
+    # Stream the JSON into the temp file rather than building it as one string
+    with atomic_open(filepath) as f:
+        SessionManager.dump_json_to(f)
+    st.session_state['_saved_file'] = _file_stamp(filepath)
+    SessionManager.mark_clean(fingerprint)
+
+
+def _file_stamp(filepath):
+    """(path, mtime) of a file, or None if it doesn't exist."""
+    try:
+        return str(filepath), filepath.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+# Page id -> render function (ids match NAV_PAGE_LABELS)
+PAGE_RENDERERS = {
+    'home': render_home_page,
+    'import_export': render_import_export,
+    'cover': render_cover_page,
+    'part_a': render_part_a,
+    'part_b': render_part_b,
+    'part_c': render_part_c,
+    'part_d': render_part_d,
+    'part_e': render_part_e,
+    'part_f': render_part_f,
+    'part_g': render_part_g,
+    'generate': render_generate_page,
+}
 
 
 def main():
@@ -1694,23 +1916,14 @@ def main():
     if page != 'home':
         render_breadcrumb(page, data.chapter_title if data else None)
 
-    pages = {
-        'home': render_home_page,
-        'import_export': render_import_export,
-        'cover': render_cover_page,
-        'part_a': render_part_a,
-        'part_b': render_part_b,
-        'part_c': render_part_c,
-        'part_d': render_part_d,
-        'part_e': render_part_e,
-        'part_f': render_part_f,
-        'part_g': render_part_g,
-        'generate': render_generate_page,
-    }
-
-    render_func = pages.get(page, render_home_page)
+    render_func = PAGE_RENDERERS.get(page, render_home_page)
     render_func()
 
+    if st.session_state.pop('_save_requested', False):
+        save_chapter()
+        st.toast("Project saved successfully!", icon="✅")
+        st.rerun()
+
 
 if __name__ == "__main__":
     main()
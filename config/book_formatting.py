@@ -9,6 +9,8 @@ consistency across the entire publication.
 Based on analysis of: Ch-1_History_CBSE_Class_10_FINAL.docx
 """
 
+from functools import lru_cache
+
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches, Pt, RGBColor
 
@@ -79,8 +81,13 @@ class BookColors:
     BORDER_RED = '#B91C1C'            # Warning box left border
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def hex_to_rgb(hex_color: str) -> RGBColor:
-        """Convert hex color to python-docx RGBColor."""
+        """Convert hex color to python-docx RGBColor.
+
+        Cached: the palette is a handful of constants and RGBColor is an
+        immutable tuple, so every run can share the same instance.
+        """
         hex_color = hex_color.lstrip('#')
         r = int(hex_color[0:2], 16)
         g = int(hex_color[2:4], 16)
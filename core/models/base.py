@@ -4,26 +4,68 @@ Defines the structure of chapter data using Pydantic.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+# Called on every edit to a chapter model; SessionManager installs one so that
+# committing unchanged data can be skipped without re-serializing the chapter
+_edit_listener: Optional[Callable[[], None]] = None
 
-class CustomBox(BaseModel):
+
+def set_edit_listener(listener: Optional[Callable[[], None]]) -> None:
+    """Register the function called whenever a chapter model is edited."""
+    global _edit_listener
+    _edit_listener = listener
+
+
+def note_edit() -> None:
+    """
+    Report an edit that field assignment can't see, e.g. appending to or
+    popping from a model's list in place.
+    """
+    if _edit_listener is not None:
+        _edit_listener()
+
+
+class TrackedModel(BaseModel):
+    """Base for chapter models: assigning a field a new value reports an edit."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in type(self).model_fields and getattr(self, name) != value:
+            note_edit()
+        super().__setattr__(name, value)
+
+
+class WidgetKeyed(TrackedModel):
+    """
+    Base for list items edited with per-item widgets.
+    Each instance gets a stable key (not serialized) so widget state stays
+    attached to the item when earlier items are deleted.
+    """
+    _widget_key: str = PrivateAttr(default_factory=lambda: uuid4().hex[:8])
+
+    @property
+    def widget_key(self) -> str:
+        return self._widget_key
+
+
+class CustomBox(WidgetKeyed):
     """A custom colored box for concepts."""
     title: str = Field(default="")
     content: str = Field(default="")
     background_color: str = Field(default="#F3F4F6")  # Light grey default
 
 
-class ConceptTable(BaseModel):
+class ConceptTable(WidgetKeyed):
     """A table within a concept."""
     title: str = Field(default="")
     headers: List[str] = Field(default_factory=lambda: ["Column 1", "Column 2"])
     rows: List[List[str]] = Field(default_factory=list)
 
 
-class ConceptItem(BaseModel):
+class ConceptItem(WidgetKeyed):
     """A single concept/topic in Part B."""
     number: int = Field(default=1, ge=1)
     title: str = Field(default="")
@@ -41,7 +83,7 @@ class ConceptItem(BaseModel):
         return len(self.content.split()) if self.content else 0
 
 
-class PYQItem(BaseModel):
+class PYQItem(TrackedModel):
     """A Previous Year Question item for Part A."""
     question: str = Field(default="")
     marks: str = Field(default="3M")
@@ -56,7 +98,7 @@ class PYQItem(BaseModel):
         return not self.question
 
 
-class QuestionItem(BaseModel):
+class QuestionItem(WidgetKeyed):
     """A question item for Part D."""
     question: str = Field(default="")
     marks: int = Field(default=1, ge=1)
@@ -69,7 +111,7 @@ class QuestionItem(BaseModel):
         return not self.question
 
 
-class ModelAnswer(BaseModel):
+class ModelAnswer(WidgetKeyed):
     """A model answer item for Part C."""
     question: str = Field(default="")
     marks: int = Field(default=3)
@@ -80,7 +122,7 @@ class ModelAnswer(BaseModel):
         return not self.question and not self.answer
 
 
-class PartData(BaseModel):
+class PartData(TrackedModel):
     """Data for a single part (A-G or custom)."""
     id: str
     name: str
@@ -88,7 +130,7 @@ class PartData(BaseModel):
     content: Dict[str, Any] = Field(default_factory=dict)
 
 
-class ChapterData(BaseModel):
+class ChapterData(TrackedModel):
     """Complete data model for a chapter."""
 
     # =========================================================================
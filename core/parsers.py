@@ -3,10 +3,17 @@ Document parsers for importing chapter data from DOCX and PDF files.
 Enhanced with comprehensive section parsing and validation.
 """
 
+import codecs
 import json
 import re
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Optional: faster JSON decoding for imports
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from utils.logger import get_logger
 from .models.base import ChapterData
@@ -64,6 +71,10 @@ class JsonValidator:
 
     REQUIRED_FIELDS = ['chapter_data']
     CHAPTER_REQUIRED = ['class_num', 'subject', 'chapter_number']
+    VALID_CLASSES = (9, 10, 11, 12)
+    VALID_SUBJECTS = ('history', 'geography', 'civics', 'economics')
+    LIST_FIELDS = ('concepts', 'pyq_items', 'model_answers', 'mcqs',
+                   'short_answer', 'long_answer', 'map_items')
 
     @classmethod
     def validate(cls, data: Dict) -> Tuple[bool, List[str]]:
@@ -92,7 +103,7 @@ class JsonValidator:
             if 'class_num' in chapter:
                 if not isinstance(chapter['class_num'], int):
                     errors.append("'class_num' must be an integer")
-                elif chapter['class_num'] not in [9, 10, 11, 12]:
+                elif chapter['class_num'] not in cls.VALID_CLASSES:
                     errors.append("'class_num' must be 9, 10, 11, or 12")
 
             if 'chapter_number' in chapter:
@@ -102,30 +113,31 @@ class JsonValidator:
                     errors.append("'chapter_number' must be positive")
 
             if 'subject' in chapter:
-                valid_subjects = ['history', 'geography', 'civics', 'economics']
-                if chapter['subject'] not in valid_subjects:
-                    errors.append(f"'subject' must be one of: {valid_subjects}")
+                if chapter['subject'] not in cls.VALID_SUBJECTS:
+                    errors.append(f"'subject' must be one of: {list(cls.VALID_SUBJECTS)}")
 
             # Validate list fields
-            list_fields = ['concepts', 'pyq_items', 'model_answers', 'mcqs',
-                           'short_answer', 'long_answer', 'map_items']
-            for field in list_fields:
+            for field in cls.LIST_FIELDS:
                 if field in chapter and not isinstance(chapter[field], list):
                     errors.append(f"'{field}' must be a list")
 
         return len(errors) == 0, errors
 
     @classmethod
-    def validate_json_string(cls, json_str: str) -> Tuple[bool, Dict, List[str]]:
+    def validate_json_string(cls, json_str: Union[str, bytes]) -> Tuple[bool, Dict, List[str]]:
         """
-        Parse and validate a JSON string.
+        Parse and validate a JSON string (str or UTF-8 bytes).
 
         Returns:
             Tuple of (is_valid, parsed_data, error messages)
         """
+        if isinstance(json_str, bytes) and json_str.startswith(codecs.BOM_UTF8):
+            json_str = json_str[len(codecs.BOM_UTF8):]  # stdlib json skips it, orjson rejects it
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(json_str) if orjson else json.loads(json_str)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
+            return False, {}, [f"Invalid JSON: {str(e)}"]
+        except UnicodeDecodeError as e:  # stdlib json given non-UTF-8 bytes
             return False, {}, [f"Invalid JSON: {str(e)}"]
 
         is_valid, errors = cls.validate(data)
@@ -737,11 +749,8 @@ class PdfParser:
             try:
                 import fitz  # PyMuPDF
 
-                doc = fitz.open(stream=file_bytes, filetype="pdf")
-                text_content = ""
-                for page in doc:
-                    text_content += page.get_text()
-                doc.close()
+                with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+                    text_content = "".join(page.get_text() for page in doc)
 
             except ImportError:
                 # Fallback to pdfplumber
@@ -749,9 +758,7 @@ class PdfParser:
                     import pdfplumber
 
                     with pdfplumber.open(BytesIO(file_bytes)) as pdf:
-                        text_content = ""
-                        for page in pdf.pages:
-                            text_content += page.extract_text() or ""
+                        text_content = "".join(page.extract_text() or "" for page in pdf.pages)
 
                 except ImportError:
                     # Neither library is available
@@ -3,7 +3,7 @@ Progress tracking for Guide Book Generator.
 Calculates completion percentages for each section and overall.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .models.base import ChapterData
 from .models.parts import PartManager
@@ -274,9 +274,13 @@ class ProgressTracker:
 
         return progress
 
-    def get_overall_progress(self) -> float:
-        """Calculate overall completion percentage."""
-        all_progress = self.get_all_progress()
+    def get_overall_progress(self, all_progress: Optional[Dict[str, Dict]] = None) -> float:
+        """
+        Calculate overall completion percentage.
+        Pass the result of get_all_progress() to avoid recomputing it.
+        """
+        if all_progress is None:
+            all_progress = self.get_all_progress()
 
         if not all_progress:
             return 0
@@ -287,7 +291,7 @@ class ProgressTracker:
     def get_progress_summary(self) -> Dict:
         """Get a summary of progress including counts."""
         all_progress = self.get_all_progress()
-        overall = self.get_overall_progress()
+        overall = self.get_overall_progress(all_progress)
 
         complete_count = sum(1 for p in all_progress.values() if p['percentage'] >= self.THRESHOLD_COMPLETE)
         partial_count = sum(1 for p in all_progress.values()
@@ -306,12 +310,14 @@ class ProgressTracker:
             }
         }
 
-    def get_sidebar_display(self) -> List[Tuple[str, str, float]]:
+    def get_sidebar_display(self, all_progress: Optional[Dict[str, Dict]] = None) -> List[Tuple[str, str, float]]:
         """
         Get progress data formatted for sidebar display.
         Returns list of (name, status_emoji, percentage) tuples.
+        Pass the result of get_all_progress() to avoid recomputing it.
         """
-        all_progress = self.get_all_progress()
+        if all_progress is None:
+            all_progress = self.get_all_progress()
         display = []
 
         # Cover page first
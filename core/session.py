@@ -3,13 +3,22 @@ Session state management for Guide Book Generator.
 Handles Streamlit session state for chapter data and app state.
 """
 
+import codecs
+import hashlib
 import json
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
-from .models.base import ChapterData
+# Optional: faster JSON encoding for export/autosave
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .models.base import ChapterData, set_edit_listener
 from .models.parts import PartManager
 
 
@@ -30,6 +39,9 @@ class SessionManager:
     KEY_IS_DIRTY = 'is_dirty'
     KEY_AUTOSAVE_ENABLED = 'autosave_enabled'
     KEY_SHOW_PREVIEW = 'show_preview'
+    KEY_DATA_REVISION = 'data_revision'
+    KEY_DATA_EDITED = 'data_edited'
+    KEY_SAVED_FINGERPRINT = 'saved_fingerprint'
 
     @classmethod
     def initialize(cls) -> None:
@@ -45,6 +57,9 @@ class SessionManager:
             cls.KEY_IS_DIRTY: False,
             cls.KEY_AUTOSAVE_ENABLED: True,
             cls.KEY_SHOW_PREVIEW: False,
+            cls.KEY_DATA_REVISION: 0,
+            cls.KEY_DATA_EDITED: False,
+            cls.KEY_SAVED_FINGERPRINT: None,
         }
 
         for key, default_value in defaults.items():
@@ -59,10 +74,34 @@ class SessionManager:
 
     @classmethod
     def set_chapter_data(cls, data: ChapterData) -> None:
-        """Set the chapter data and mark as dirty."""
+        """
+        Set the chapter data and mark as dirty.
+        Pages and fragments call this on every rerun, so re-setting the current
+        object is a no-op unless one of its models was edited since the last
+        commit (reported through the models' edit listener).
+        """
         cls.initialize()
+        if (data is st.session_state[cls.KEY_CHAPTER_DATA]
+                and not st.session_state[cls.KEY_DATA_EDITED]):
+            return
         st.session_state[cls.KEY_CHAPTER_DATA] = data
+        st.session_state[cls.KEY_DATA_EDITED] = False
         st.session_state[cls.KEY_IS_DIRTY] = True
+        cls._bump_revision()
+
+    @classmethod
+    def _note_edit(cls) -> None:
+        """Edit listener for the chapter models: flag this session's data as edited."""
+        # Models are also edited outside a script run (parsers, tests); ignore those
+        if get_script_run_ctx(suppress_warning=True) is not None:
+            st.session_state[cls.KEY_DATA_EDITED] = True
+
+    @staticmethod
+    def content_fingerprint(data: Optional[ChapterData]) -> Optional[str]:
+        """Hash of the full chapter content, used when saving to detect real changes."""
+        if data is None:
+            return None
+        return hashlib.md5(data.model_dump_json().encode('utf-8')).hexdigest()
 
     @classmethod
     def get_part_manager(cls) -> PartManager:
@@ -77,6 +116,7 @@ class SessionManager:
         """Set the part manager."""
         cls.initialize()
         st.session_state[cls.KEY_PART_MANAGER] = manager
+        cls._bump_revision()
 
     @classmethod
     def create_new_chapter(
@@ -110,7 +150,20 @@ class SessionManager:
         if data and hasattr(data, field_name):
             setattr(data, field_name, value)
             data.update_timestamp()
+            st.session_state[cls.KEY_DATA_EDITED] = False
             st.session_state[cls.KEY_IS_DIRTY] = True
+            cls._bump_revision()
+
+    @classmethod
+    def _bump_revision(cls) -> None:
+        """Advance the data revision so derived values get recomputed."""
+        st.session_state[cls.KEY_DATA_REVISION] = st.session_state.get(cls.KEY_DATA_REVISION, 0) + 1
+
+    @classmethod
+    def get_data_revision(cls) -> int:
+        """Get a counter that changes whenever chapter data or parts are updated."""
+        cls.initialize()
+        return st.session_state[cls.KEY_DATA_REVISION]
 
     @classmethod
     def get_current_selection(cls) -> Dict[str, Any]:
@@ -149,11 +202,18 @@ class SessionManager:
         return st.session_state.get(cls.KEY_IS_DIRTY, False)
 
     @classmethod
-    def mark_clean(cls) -> None:
-        """Mark the session as clean (saved)."""
+    def mark_clean(cls, fingerprint: Optional[str] = None) -> None:
+        """Mark the session as clean (saved), recording the saved content's fingerprint."""
         cls.initialize()
         st.session_state[cls.KEY_IS_DIRTY] = False
         st.session_state[cls.KEY_LAST_SAVE_TIME] = datetime.now()
+        st.session_state[cls.KEY_SAVED_FINGERPRINT] = fingerprint
+
+    @classmethod
+    def get_saved_fingerprint(cls) -> Optional[str]:
+        """Get the content fingerprint recorded by the last save (None if unknown)."""
+        cls.initialize()
+        return st.session_state[cls.KEY_SAVED_FINGERPRINT]
 
     @classmethod
     def get_last_save_time(cls) -> Optional[datetime]:
@@ -181,6 +241,8 @@ class SessionManager:
             cls.KEY_PART_MANAGER,
             cls.KEY_IS_DIRTY,
             cls.KEY_LAST_SAVE_TIME,
+            cls.KEY_DATA_EDITED,
+            cls.KEY_SAVED_FINGERPRINT,
         ]
         for key in keys_to_reset:
             if key in st.session_state:
@@ -192,21 +254,57 @@ class SessionManager:
         """Export current chapter data to JSON string."""
         data = cls.get_chapter_data()
         if data:
-            export_data = {
-                'chapter_data': data.to_autosave_dict(),
-                'part_manager': cls.get_part_manager().to_dict(),
-                'exported_at': datetime.now().isoformat(),
-            }
-            return json.dumps(export_data, indent=2, ensure_ascii=False)
+            return cls.serialize_export(data, cls.get_part_manager())
         return None
 
     @classmethod
-    def import_from_json(cls, json_string: str, show_preview: bool = False) -> Dict[str, Any]:
+    def dump_json_to(cls, fp) -> bool:
+        """
+        Write the current chapter export JSON to a binary file object.
+        Encodes straight into the file instead of building the whole JSON
+        string first. Returns False if there is no chapter to write.
+        """
+        data = cls.get_chapter_data()
+        if not data:
+            return False
+        export_data = cls._export_payload(data, cls.get_part_manager())
+        if orjson:
+            fp.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            json.dump(export_data, codecs.getwriter('utf-8')(fp), indent=2, ensure_ascii=False)
+        return True
+
+    @staticmethod
+    def _export_payload(data: ChapterData, part_manager: PartManager) -> Dict[str, Any]:
+        """The export/autosave document: chapter data, parts and a timestamp."""
+        return {
+            'chapter_data': data.to_autosave_dict(),
+            'part_manager': part_manager.to_dict(),
+            'exported_at': datetime.now().isoformat(),
+        }
+
+    @staticmethod
+    def serialize_export(data: ChapterData, part_manager: PartManager) -> str:
+        """
+        Serialize chapter data and parts to the export JSON format.
+        Doesn't touch session state, so it can run outside the script thread
+        (e.g. as a deferred st.download_button data callable).
+        """
+        export_data = SessionManager._export_payload(data, part_manager)
+        if orjson:
+            return orjson.dumps(export_data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        return json.dumps(export_data, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def import_from_json(cls, json_string: Union[str, bytes, Dict[str, Any]],
+                         show_preview: bool = False) -> Dict[str, Any]:
         """
         Import chapter data from JSON string with validation.
 
         Args:
-            json_string: JSON string containing chapter data
+            json_string: JSON string (or UTF-8 bytes) containing chapter data,
+                or the already parsed dict (e.g. the 'data' of an earlier
+                preview result)
             show_preview: If True, validates but doesn't import (for preview)
 
         Returns:
@@ -223,7 +321,11 @@ class SessionManager:
         }
 
         # Validate JSON structure
-        is_valid, parsed_data, errors = JsonValidator.validate_json_string(json_string)
+        if isinstance(json_string, dict):
+            parsed_data = json_string
+            is_valid, errors = JsonValidator.validate(parsed_data)
+        else:
+            is_valid, parsed_data, errors = JsonValidator.validate_json_string(json_string)
 
         if not is_valid:
             result['errors'] = errors
@@ -306,3 +408,6 @@ class SessionManager:
             'last_save': cls.get_last_save_time(),
             'autosave_enabled': cls.is_autosave_enabled(),
         }
+
+
+set_edit_listener(SessionManager._note_edit)
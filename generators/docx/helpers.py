@@ -322,7 +322,7 @@ class DocxHelpers:
                         
                         if i % 2 == 1: # Year match
                             run.font.bold = True
-                            run.font.color.rgb = Colors.hex_to_rgb(Colors.YEAR_RED)
+                            run.font.color.rgb = Colors.YEAR_RED_RGB
                         elif default_color:
                             run.font.color.rgb = Colors.hex_to_rgb(default_color)
                 else:
@@ -411,7 +411,7 @@ class DocxHelpers:
                 run = para.add_run(f"{label} ")
                 run.font.name = Fonts.PRIMARY
                 run.font.size = Fonts.SIZE_BODY_SMALL
-                run.font.color.rgb = Colors.hex_to_rgb(Colors.DARK_GRAY)
+                run.font.color.rgb = Colors.DARK_GRAY_RGB
 
                 run = para.add_run(value)
                 run.font.name = Fonts.PRIMARY
@@ -453,7 +453,7 @@ class DocxHelpers:
             run.font.name = Fonts.PRIMARY
             run.font.size = Fonts.SIZE_TABLE_HEADER
             run.font.bold = True
-            run.font.color.rgb = Colors.hex_to_rgb(Colors.BODY_TEXT)  # Dark gray text
+            run.font.color.rgb = Colors.BODY_TEXT_RGB  # Dark gray text
 
         # Data rows
         for q in questions:
@@ -491,7 +491,7 @@ class DocxHelpers:
             run.font.name = Fonts.PRIMARY
             run.font.size = Fonts.SIZE_BODY
             run.font.bold = True
-            run.font.color.rgb = Colors.hex_to_rgb(Colors.PRIMARY_BLUE)
+            run.font.color.rgb = Colors.PRIMARY_BLUE_RGB
 
             # Years cell
             cell = row.cells[2]
@@ -535,7 +535,7 @@ class DocxHelpers:
             run.font.name = Fonts.PRIMARY
             run.font.size = Fonts.SIZE_TABLE_HEADER
             run.font.bold = True
-            run.font.color.rgb = Colors.hex_to_rgb(Colors.PRIMARY_BLUE)  # Blue text on light blue bg
+            run.font.color.rgb = Colors.PRIMARY_BLUE_RGB  # Blue text on light blue bg
 
         # Data rows
         for row_data in rows:
@@ -556,7 +556,7 @@ class DocxHelpers:
         run = para.add_run(line_char * count)
         run.font.name = Fonts.DECORATIVE
         run.font.size = Pt(12)
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.DARK_GRAY)
+        run.font.color.rgb = Colors.DARK_GRAY_RGB
         return para
 
     @staticmethod
@@ -657,7 +657,7 @@ class DocxHelpers:
         else:
             run.font.size = Pt(14)
 
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.HEADING_BLUE)
+        run.font.color.rgb = Colors.HEADING_BLUE_RGB
 
         para.paragraph_format.space_before = Spacing.PARA_BEFORE_LARGE
         para.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
@@ -686,7 +686,7 @@ class DocxHelpers:
         run.font.name = Fonts.PRIMARY
         run.font.size = Fonts.SIZE_BODY
         run.font.italic = True
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.SUCCESS_GREEN)
+        run.font.color.rgb = Colors.SUCCESS_GREEN_RGB
 
         # Acronym (bold italic)
         run = para.add_run(acronym)
@@ -694,21 +694,21 @@ class DocxHelpers:
         run.font.size = Fonts.SIZE_BODY
         run.font.bold = True
         run.font.italic = True
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.SUCCESS_GREEN)
+        run.font.color.rgb = Colors.SUCCESS_GREEN_RGB
 
         # " — " separator
         run = para.add_run(" — ")
         run.font.name = Fonts.PRIMARY
         run.font.size = Fonts.SIZE_BODY
         run.font.italic = True
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.SUCCESS_GREEN)
+        run.font.color.rgb = Colors.SUCCESS_GREEN_RGB
 
         # Explanation (italic)
         run = para.add_run(explanation)
         run.font.name = Fonts.PRIMARY
         run.font.size = Fonts.SIZE_BODY
         run.font.italic = True
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.SUCCESS_GREEN)
+        run.font.color.rgb = Colors.SUCCESS_GREEN_RGB
 
         return para
 
@@ -747,7 +747,7 @@ class DocxHelpers:
         run.font.name = Fonts.PRIMARY
         run.font.size = Fonts.SIZE_BODY
         run.font.bold = True
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.PRIMARY_BLUE)
+        run.font.color.rgb = Colors.PRIMARY_BLUE_RGB
 
         # Content (quoted)
         run = para.add_run(f'"{content}"')
@@ -792,7 +792,7 @@ class DocxHelpers:
         run.font.name = Fonts.PRIMARY
         run.font.size = Fonts.SIZE_BODY
         run.font.bold = True
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.WARNING_ORANGE)
+        run.font.color.rgb = Colors.WARNING_ORANGE_RGB
 
         # Content
         run = para.add_run(content)
@@ -837,7 +837,7 @@ class DocxHelpers:
             run.font.name = Fonts.PRIMARY
             run.font.size = Fonts.SIZE_TABLE_HEADER
             run.font.bold = True
-            run.font.color.rgb = Colors.hex_to_rgb(Colors.HEADING_BLUE)
+            run.font.color.rgb = Colors.HEADING_BLUE_RGB
 
         # Data rows
         for event in events:
@@ -896,7 +896,7 @@ class DocxHelpers:
             run.font.name = Fonts.PRIMARY
             run.font.size = Fonts.SIZE_TABLE_HEADER
             run.font.bold = True
-            run.font.color.rgb = Colors.hex_to_rgb(Colors.HEADING_BLUE)
+            run.font.color.rgb = Colors.HEADING_BLUE_RGB
 
         # Data rows
         for term_data in terms:
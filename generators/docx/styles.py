@@ -39,7 +39,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_CHAPTER_TITLE
             style.font.bold = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.PRIMARY_BLUE)
+            style.font.color.rgb = Colors.PRIMARY_BLUE_RGB
             style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_NORMAL
             style.paragraph_format.space_after = Spacing.PARA_AFTER_NORMAL
@@ -50,7 +50,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_PART_HEADER
             style.font.bold = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.PRIMARY_BLUE)
+            style.font.color.rgb = Colors.PRIMARY_BLUE_RGB
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_SECTION
             style.paragraph_format.space_after = Spacing.PARA_AFTER_NORMAL
 
@@ -61,7 +61,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_PART_HEADER  # 16pt
             style.font.bold = False  # Reference shows normal weight
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.HEADING_BLUE)  # #2563EB
+            style.font.color.rgb = Colors.HEADING_BLUE_RGB  # #2563EB
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_LARGE
             style.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
 
@@ -72,7 +72,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_SECTION_TITLE  # 14pt
             style.font.bold = False  # Reference shows normal weight
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.HEADING_BLUE)  # #2563EB
+            style.font.color.rgb = Colors.HEADING_BLUE_RGB  # #2563EB
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_NORMAL
             style.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
 
@@ -82,7 +82,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_SECTION_TITLE
             style.font.bold = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.HEADING_BLUE)  # Updated to HEADING_BLUE
+            style.font.color.rgb = Colors.HEADING_BLUE_RGB  # Updated to HEADING_BLUE
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_LARGE
             style.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
 
@@ -92,7 +92,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_CONCEPT_TITLE
             style.font.bold = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.HEADING_BLUE)  # Updated to HEADING_BLUE
+            style.font.color.rgb = Colors.HEADING_BLUE_RGB  # Updated to HEADING_BLUE
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_LARGE
             style.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
 
@@ -105,7 +105,7 @@ class DocxStyles:
             style = styles.add_style('BodyText', WD_STYLE_TYPE.PARAGRAPH)
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_BODY
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.BLACK)  # Pure black for body
+            style.font.color.rgb = Colors.BLACK_RGB  # Pure black for body
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_SMALL
             style.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
             style.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
@@ -115,7 +115,7 @@ class DocxStyles:
             style = styles.add_style('HeaderText', WD_STYLE_TYPE.PARAGRAPH)
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_SECTION_TITLE
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.DARK_GRAY)
+            style.font.color.rgb = Colors.DARK_GRAY_RGB
             style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
             style.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
 
@@ -124,7 +124,7 @@ class DocxStyles:
             style = styles.add_style('DecorativeLine', WD_STYLE_TYPE.PARAGRAPH)
             style.font.name = Fonts.DECORATIVE
             style.font.size = Pt(12)
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.DARK_GRAY)
+            style.font.color.rgb = Colors.DARK_GRAY_RGB
             style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_SMALL
             style.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
@@ -135,7 +135,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_BODY
             style.font.bold = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.BLACK)
+            style.font.color.rgb = Colors.BLACK_RGB
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_NORMAL
             style.paragraph_format.space_after = Spacing.PARA_AFTER_SMALL
 
@@ -144,7 +144,7 @@ class DocxStyles:
             style = styles.add_style('Answer', WD_STYLE_TYPE.PARAGRAPH)
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_BODY
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.DARK_GRAY)
+            style.font.color.rgb = Colors.DARK_GRAY_RGB
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_SMALL
             style.paragraph_format.space_after = Spacing.PARA_AFTER_NORMAL
             style.paragraph_format.left_indent = Inches(0.25)
@@ -155,7 +155,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_BODY_SMALL
             style.font.italic = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.SUCCESS_GREEN)
+            style.font.color.rgb = Colors.SUCCESS_GREEN_RGB
             style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT
             style.paragraph_format.space_before = Spacing.PARA_BEFORE_SMALL
 
@@ -164,7 +164,7 @@ class DocxStyles:
             style = styles.add_style('FooterText', WD_STYLE_TYPE.PARAGRAPH)
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_FOOTER
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.LIGHT_GRAY)
+            style.font.color.rgb = Colors.LIGHT_GRAY_RGB
             style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         # BOOK STANDARD: Year style (red bold) for important dates
@@ -173,7 +173,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_BODY
             style.font.bold = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.YEAR_RED)  # #DC2626
+            style.font.color.rgb = Colors.YEAR_RED_RGB  # #DC2626
 
         # BOOK STANDARD: Key Term style (bold black)
         if 'KeyTerm' not in [s.name for s in styles]:
@@ -181,7 +181,7 @@ class DocxStyles:
             style.font.name = Fonts.PRIMARY
             style.font.size = Fonts.SIZE_BODY
             style.font.bold = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.BLACK)
+            style.font.color.rgb = Colors.BLACK_RGB
 
         # BOOK STANDARD: Foreign Term style (bold italic)
         if 'ForeignTerm' not in [s.name for s in styles]:
@@ -190,7 +190,7 @@ class DocxStyles:
             style.font.size = Fonts.SIZE_BODY
             style.font.bold = True
             style.font.italic = True
-            style.font.color.rgb = Colors.hex_to_rgb(Colors.BLACK)
+            style.font.color.rgb = Colors.BLACK_RGB
 
     def _setup_table_styles(self):
         """Set up table styles."""
@@ -230,7 +230,7 @@ class DocxStyles:
             run.font.name = Fonts.PRIMARY
             run.font.size = Fonts.SIZE_FOOTER
             run.font.italic = True
-            run.font.color.rgb = Colors.hex_to_rgb(Colors.PRIMARY_BLUE)
+            run.font.color.rgb = Colors.PRIMARY_BLUE_RGB
 
     def add_footer_with_page_numbers(self, position: str = 'Bottom Center'):
         """Add footer with page numbers."""
@@ -250,7 +250,7 @@ class DocxStyles:
         run = footer_para.add_run('───── ')
         run.font.name = Fonts.DECORATIVE
         run.font.size = Fonts.SIZE_FOOTER
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.LIGHT_GRAY)
+        run.font.color.rgb = Colors.LIGHT_GRAY_RGB
 
         # Add page number field
         self._add_page_number_field(footer_para)
@@ -258,7 +258,7 @@ class DocxStyles:
         run = footer_para.add_run(' ─────')
         run.font.name = Fonts.DECORATIVE
         run.font.size = Fonts.SIZE_FOOTER
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.LIGHT_GRAY)
+        run.font.color.rgb = Colors.LIGHT_GRAY_RGB
 
     def _add_page_number_field(self, paragraph):
         """Add a page number field to a paragraph."""
@@ -279,7 +279,7 @@ class DocxStyles:
 
         run.font.name = Fonts.PRIMARY
         run.font.size = Fonts.SIZE_FOOTER
-        run.font.color.rgb = Colors.hex_to_rgb(Colors.LIGHT_GRAY)
+        run.font.color.rgb = Colors.LIGHT_GRAY_RGB
 
 
 def create_styled_document(page_size: str = 'A4') -> tuple:
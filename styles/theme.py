@@ -4,6 +4,8 @@ All colors, fonts, and styling values used throughout the application.
 Matches the demo PDF exactly.
 """
 
+from functools import lru_cache
+
 from docx.shared import Inches, Pt, RGBColor, Twips
 
 # =============================================================================
@@ -65,9 +67,25 @@ class Colors:
     TABLE_HEADER_BLUE = '#DBEAFE'
     TABLE_HEADER_GRAY = '#F3F4F6'
 
+    # RGBColor forms of the text colors the DOCX helpers set on runs
+    PRIMARY_BLUE_RGB = RGBColor.from_string(PRIMARY_BLUE[1:])
+    HEADING_BLUE_RGB = RGBColor.from_string(HEADING_BLUE[1:])
+    YEAR_RED_RGB = RGBColor.from_string(YEAR_RED[1:])
+    BODY_TEXT_RGB = RGBColor.from_string(BODY_TEXT[1:])
+    SUCCESS_GREEN_RGB = RGBColor.from_string(SUCCESS_GREEN[1:])
+    WARNING_ORANGE_RGB = RGBColor.from_string(WARNING_ORANGE[1:])
+    DARK_GRAY_RGB = RGBColor.from_string(DARK_GRAY[1:])
+    LIGHT_GRAY_RGB = RGBColor.from_string(LIGHT_GRAY[1:])
+    BLACK_RGB = RGBColor.from_string(BLACK[1:])
+
     @staticmethod
+    @lru_cache(maxsize=64)
     def hex_to_rgb(hex_color: str) -> RGBColor:
-        """Convert hex color to python-docx RGBColor."""
+        """Convert hex color to python-docx RGBColor.
+
+        Cached: the palette is a handful of constants and RGBColor is an
+        immutable tuple, so every run can share the same instance.
+        """
         hex_color = hex_color.lstrip('#')
         r = int(hex_color[0:2], 16)
         g = int(hex_color[2:4], 16)
@@ -337,14 +355,14 @@ class Difficulty:
 class Weightage:
     """Weightage options for chapters."""
 
-    OPTIONS = [
+    OPTIONS = (
         '1-2 Marks',
         '2-3 Marks',
         '3-4 Marks',
         '4-5 Marks',
         '5-6 Marks',
         '6-8 Marks',
-    ]
+    )
 
     DEFAULT = '4-5 Marks'
 
@@ -356,7 +374,7 @@ class Weightage:
 class Importance:
     """Importance level options."""
 
-    OPTIONS = ['High', 'Medium', 'Low-Medium', 'Low']
+    OPTIONS = ('High', 'Medium', 'Low-Medium', 'Low')
     DEFAULT = 'High'
 
 
@@ -367,7 +385,7 @@ class Importance:
 class PYQFrequency:
     """PYQ frequency options."""
 
-    OPTIONS = ['Every Year', 'High', 'Moderate', 'Low', 'Rare']
+    OPTIONS = ('Every Year', 'High', 'Moderate', 'Low', 'Rare')
     DEFAULT = 'Every Year'
 
 
@@ -378,13 +396,13 @@ class PYQFrequency:
 class YearRange:
     """Year range options for PYQ analysis."""
 
-    OPTIONS = [
+    OPTIONS = (
         '2015-2024',
         '2016-2025',
         '2017-2026',
         '2018-2027',
         '2019-2028',
-    ]
+    )
     DEFAULT = '2015-2024'
 
 
@@ -0,0 +1,63 @@
+"""
+Tests for how page edits mark the chapter as changed.
+"""
+
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from core.models.base import ChapterData
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / "app.py")
+
+
+class TestEditTracking:
+    """Tests for the unsaved flag and data revision on the editor pages."""
+
+    @pytest.fixture
+    def app(self):
+        """Run the app with a clean chapter loaded."""
+        at = AppTest.from_file(APP_PATH, default_timeout=60)
+        at.run()
+        at.session_state["chapter_data"] = ChapterData(chapter_title="Tracked")
+        at.run()
+        return at
+
+    def open_page(self, at, page):
+        """Helper to open a page, let its widgets settle and clear the unsaved flag."""
+        at.session_state["current_page"] = page
+        at.run()
+        at.run()
+        at.session_state["is_dirty"] = False
+        return at.session_state["data_revision"]
+
+    def test_part_description_edit_is_tracked(self, app):
+        """Test typing a part description marks the chapter as changed."""
+        rev = self.open_page(app, "cover")
+
+        app.text_input(key="part_desc_A").set_value("Introduction").run()
+        assert not app.exception
+        assert app.session_state["chapter_data"].part_descriptions["A"] == "Introduction"
+        assert app.session_state["data_revision"] > rev
+        assert app.session_state["is_dirty"] is True
+
+    def test_page_setup_controls_stay_in_sync(self, app):
+        """Test the Generate page and sidebar page size controls agree and idle reruns change nothing."""
+        self.open_page(app, "generate")
+
+        app.selectbox(key="page_size").set_value("A5").run()
+        assert not app.exception
+        assert app.session_state["chapter_data"].page_size == "A5"
+        assert app.selectbox(key="sidebar_page_size").value == "A5"
+
+        app.session_state["is_dirty"] = False
+        rev = app.session_state["data_revision"]
+        app.run()
+        app.run()
+        assert app.session_state["data_revision"] == rev
+        assert app.session_state["is_dirty"] is False
+
+        app.checkbox(key="sidebar_add_page_numbers").uncheck().run()
+        assert app.session_state["chapter_data"].add_page_numbers is False
+        assert app.checkbox(key="page_numbers").value is False
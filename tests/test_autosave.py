@@ -0,0 +1,98 @@
+"""
+Tests for atomic autosave writes.
+"""
+
+import json
+import threading
+
+import pytest
+
+from utils.autosave import atomic_open, atomic_write_text
+
+
+class TestAtomicOpen:
+    """Tests for atomic_open and atomic_write_text."""
+
+    def leftover_temp_files(self, directory):
+        """Helper to list temporary files left next to the target."""
+        return sorted(path.name for path in directory.glob("*.tmp"))
+
+    def test_creates_new_file(self, tmp_path):
+        """Test writing a target that doesn't exist yet creates it."""
+        target = tmp_path / "chapter.json"
+
+        with atomic_open(target) as f:
+            f.write(b'{"new": true}')
+
+        assert target.read_bytes() == b'{"new": true}'
+        assert self.leftover_temp_files(tmp_path) == []
+
+    def test_replaces_target(self, tmp_path):
+        """Test the target only changes when the block completes."""
+        target = tmp_path / "chapter.json"
+        target.write_bytes(b"old")
+
+        with atomic_open(target) as f:
+            f.write(b"new contents")
+            f.flush()
+            assert target.read_bytes() == b"old"
+
+        assert target.read_bytes() == b"new contents"
+        assert self.leftover_temp_files(tmp_path) == []
+
+    def test_exception_keeps_old_contents(self, tmp_path):
+        """Test a failure inside the block leaves the old file and no temporary file."""
+        target = tmp_path / "chapter.json"
+        target.write_bytes(b"old")
+
+        with pytest.raises(RuntimeError, match="serialization failed"):
+            with atomic_open(target) as f:
+                f.write(b"partial")
+                raise RuntimeError("serialization failed")
+
+        assert target.read_bytes() == b"old"
+        assert self.leftover_temp_files(tmp_path) == []
+
+    def test_exception_on_new_file_leaves_nothing(self, tmp_path):
+        """Test a failed first write doesn't create the target."""
+        target = tmp_path / "chapter.json"
+
+        with pytest.raises(KeyboardInterrupt):
+            with atomic_open(target) as f:
+                f.write(b"partial")
+                raise KeyboardInterrupt
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_write_text(self, tmp_path):
+        """Test atomic_write_text writes UTF-8 and replaces the old contents."""
+        target = tmp_path / "chapter.json"
+        target.write_text("old", encoding="utf-8")
+
+        atomic_write_text(target, '{"title": "Café — ₹"}')
+
+        assert target.read_text(encoding="utf-8") == '{"title": "Café — ₹"}'
+        assert self.leftover_temp_files(tmp_path) == []
+
+    def test_concurrent_writers(self, tmp_path):
+        """Test concurrent writers of one target never leave a mixed or partial file."""
+        target = tmp_path / "chapter.json"
+        payloads = {writer: json.dumps({"writer": writer, "items": [writer] * 2000}) for writer in range(4)}
+        errors = []
+
+        def write_many(writer):
+            try:
+                for _ in range(50):
+                    atomic_write_text(target, payloads[writer])
+            except Exception as e:  # surfaced by the assertion below
+                errors.append(e)
+
+        threads = [threading.Thread(target=write_many, args=(writer,)) for writer in payloads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert target.read_text(encoding="utf-8") in payloads.values()
+        assert self.leftover_temp_files(tmp_path) == []
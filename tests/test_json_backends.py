@@ -0,0 +1,192 @@
+"""
+Tests for the fast-path libraries (orjson, ijson, segno) and their stdlib fallbacks.
+
+Each test runs once per backend; the fast backend is skipped if it isn't
+installed, the fallback is forced by hiding the module.
+"""
+
+import io
+import json
+import sys
+from datetime import datetime
+
+import pytest
+
+import app
+from core import parsers
+from core import session as session_module
+from core.models.base import ChapterData, ConceptItem, QuestionItem
+from core.models.parts import PartManager
+from core.parsers import JsonValidator
+from core.session import SessionManager
+
+
+def create_chapter():
+    """Helper to create a chapter with non-ASCII text and nested items."""
+    return ChapterData(
+        chapter_title="Café — ₹ \"quoted\"",
+        subject="history",
+        class_num=9,
+        chapter_number=4,
+        concepts=[ConceptItem(number=1, title="Concept", content="Line one\nLine two")],
+        mcqs=[QuestionItem(question="Which?", options=["a", "b", "c", "d"], answer="b")],
+    )
+
+
+def create_export():
+    """Helper to create the export document of create_chapter()."""
+    return {"chapter_data": create_chapter().to_autosave_dict(), "part_manager": PartManager().to_dict()}
+
+
+class FixedDatetime(datetime):
+    """datetime whose now() is constant, so exports can be compared byte for byte."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def decoder(request, monkeypatch):
+    """Run with orjson decoding in core.parsers, then with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(parsers, "orjson", None)
+    return request.param
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run with orjson encoding in core.session, then with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(session_module, "orjson", None)
+    monkeypatch.setattr(session_module, "datetime", FixedDatetime)
+    return request.param
+
+
+@pytest.fixture(params=["ijson", "orjson", "json"])
+def header_reader(request, monkeypatch):
+    """Run the autosave header read with ijson, the orjson whole-file parse, then stdlib json."""
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+        return request.param
+    monkeypatch.setattr(app, "ijson", None)
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(app, "orjson", None)
+    return request.param
+
+
+class TestJsonDecoding:
+    """Tests for JsonValidator.validate_json_string with either decoder."""
+
+    def test_bytes_and_str(self, decoder):
+        """Test UTF-8 bytes and str both parse to the same data."""
+        payload = json.dumps(create_export(), ensure_ascii=False)
+
+        is_valid, data, errors = JsonValidator.validate_json_string(payload.encode("utf-8"))
+        assert is_valid, errors
+        assert data["chapter_data"]["chapter_title"] == "Café — ₹ \"quoted\""
+        assert JsonValidator.validate_json_string(payload)[1] == data
+
+    def test_utf8_bom_accepted(self, decoder):
+        """Test a UTF-8 BOM (as saved by some editors) is skipped."""
+        export = create_export()
+        payload = b"\xef\xbb\xbf" + json.dumps(export).encode("utf-8")
+
+        is_valid, data, errors = JsonValidator.validate_json_string(payload)
+        assert is_valid, errors
+        assert data == export
+
+    def test_invalid_json_reported(self, decoder):
+        """Test malformed JSON and non-UTF-8 bytes become errors, not exceptions."""
+        for payload in (b'{"chapter_data": ', b'{"chapter_data": "\xff"}'):
+            is_valid, data, errors = JsonValidator.validate_json_string(payload)
+            assert not is_valid
+            assert data == {}
+            assert errors[0].startswith("Invalid JSON")
+
+
+class TestJsonEncoding:
+    """Tests for the chapter export with either encoder."""
+
+    def test_export_round_trips(self, encoder):
+        """Test the export keeps non-ASCII text and imports back to the same chapter."""
+        chapter = create_chapter()
+        text = SessionManager.serialize_export(chapter, PartManager())
+
+        assert "Café — ₹" in text
+        assert text.startswith('{\n  "chapter_data"')
+        restored = ChapterData.from_autosave_dict(json.loads(text)["chapter_data"])
+        assert restored.model_dump() == chapter.model_dump()
+
+    def test_dump_matches_serialize(self, encoder):
+        """Test writing the export to a file gives the same bytes as the string export."""
+        SessionManager.initialize()
+        SessionManager.set_chapter_data(create_chapter())
+        buf = io.BytesIO()
+
+        assert SessionManager.dump_json_to(buf) is True
+        expected = SessionManager.serialize_export(SessionManager.get_chapter_data(), SessionManager.get_part_manager())
+        assert buf.getvalue() == expected.encode("utf-8")
+
+    def test_backends_produce_identical_text(self, monkeypatch):
+        """Test orjson and the stdlib write byte-identical exports."""
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(session_module, "datetime", FixedDatetime)
+        chapter, parts = create_chapter(), PartManager()
+
+        fast = SessionManager.serialize_export(chapter, parts)
+        monkeypatch.setattr(session_module, "orjson", None)
+        assert SessionManager.serialize_export(chapter, parts) == fast
+
+
+class TestAutosaveHeader:
+    """Tests for reading the home-page summary fields of an autosave."""
+
+    def test_reads_summary_fields(self, header_reader, tmp_path):
+        """Test the title, subject and class are read from a full autosave."""
+        path = tmp_path / "autosave.json"
+        path.write_text(SessionManager.serialize_export(create_chapter(), PartManager()), encoding="utf-8")
+
+        with open(path, "rb") as file:
+            header = app._read_autosave_header(file)
+        assert header["chapter_title"] == "Café — ₹ \"quoted\""
+        assert header["subject"] == "history"
+        assert header["class_num"] == 9
+
+    def test_corrupt_file_raises_read_error(self, header_reader, tmp_path):
+        """Test a truncated autosave raises one of the errors the home page skips."""
+        path = tmp_path / "autosave.json"
+        path.write_bytes(b'{"chapter_data": {"concepts": [')
+
+        with open(path, "rb") as file, pytest.raises(app.AUTOSAVE_READ_ERRORS):
+            app._read_autosave_header(file)
+
+
+class TestQrPng:
+    """Tests for the cover page QR thumbnails with segno or qrcode."""
+
+    @pytest.fixture(params=["segno", "qrcode"])
+    def qr_encoder(self, request, monkeypatch):
+        """Run with segno, then with segno hidden so qrcode is used."""
+        if request.param == "segno":
+            pytest.importorskip("segno")
+        else:
+            monkeypatch.setitem(sys.modules, "segno", None)
+        app._qr_png.clear()
+        yield request.param
+        app._qr_png.clear()
+
+    def test_renders_png(self, qr_encoder):
+        """Test the QR code is returned as a readable PNG."""
+        from PIL import Image
+
+        png = app._qr_png("https://example.com/practice.pdf")
+        assert png.startswith(b"\x89PNG\r\n\x1a\n")
+        with Image.open(io.BytesIO(png)) as image:
+            assert image.width == image.height > 0
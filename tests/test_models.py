@@ -2,12 +2,14 @@
 Tests for core data models.
 """
 
+from core.models import base as models_base
 from core.models.base import (
     ChapterData,
     ConceptItem,
     ModelAnswer,
     PYQItem,
     QuestionItem,
+    set_edit_listener,
 )
 
 
@@ -38,6 +40,23 @@ class TestConceptItem:
         concept = ConceptItem(content="Test content here")
         assert concept.is_empty() is False
 
+    def test_widget_key_stable_and_not_serialized(self):
+        """Test a concept keeps its widget key through edits and reorders, and it stays out of dumps."""
+        first, second = ConceptItem(), ConceptItem()
+        key = first.widget_key
+
+        first.title = "Edited"
+        concepts = [second, first]
+        concepts.insert(0, ConceptItem())
+        assert concepts[2] is first
+        assert concepts[2].widget_key == key
+        assert first.model_copy(deep=True).widget_key == key
+
+        new_keys = {second.widget_key, concepts[0].widget_key}
+        assert key not in new_keys
+        assert len(new_keys) == 2
+        assert 'widget_key' not in first.model_dump()
+
     def test_word_count_empty(self):
         """Test word_count returns 0 for empty content."""
         concept = ConceptItem()
@@ -230,3 +249,36 @@ class TestChapterData:
         completion = chapter.calculate_completion()
         assert completion['cover'] == 100  # Both fields filled
         assert completion['part_a'] == 100  # Has PYQ items
+
+
+class TestEditTracking:
+    """Tests for the edit listener the chapter models report to."""
+
+    def record_edits(self):
+        """Helper to swap in a listener that counts edits; returns (edits, previous)."""
+        edits = []
+        previous = models_base._edit_listener
+        set_edit_listener(lambda: edits.append(1))
+        return edits, previous
+
+    def test_changed_field_reports_edit(self):
+        """Test assigning a different value, including on nested items, reports an edit."""
+        chapter = ChapterData(concepts=[ConceptItem()])
+        edits, previous = self.record_edits()
+        try:
+            chapter.chapter_title = "Nationalism"
+            chapter.concepts[0].content = "New content"
+        finally:
+            set_edit_listener(previous)
+        assert len(edits) == 2
+
+    def test_unchanged_field_is_silent(self):
+        """Test re-assigning the current value (as widgets do every rerun) reports nothing."""
+        chapter = ChapterData(chapter_title="Nationalism", learning_objectives="Understand")
+        edits, previous = self.record_edits()
+        try:
+            chapter.chapter_title = "Nationalism"
+            chapter.learning_objectives = "Understand"
+        finally:
+            set_edit_listener(previous)
+        assert edits == []
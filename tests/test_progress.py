@@ -298,3 +298,14 @@ class TestProgressTracker:
             assert isinstance(name, str)
             assert status in ['✅', '🔶', '⬜']
             assert isinstance(percentage, (int, float))
+
+    def test_precomputed_progress_matches(self):
+        """Test overall/sidebar helpers give the same result with precomputed progress."""
+        chapter = ChapterData(chapter_title="Test", learning_objectives="Learn")
+        chapter.pyq_items = [PYQItem(question="Q1", marks="3M", years="2023")]
+        tracker = self.create_tracker(chapter)
+
+        all_progress = tracker.get_all_progress()
+
+        assert tracker.get_overall_progress(all_progress) == tracker.get_overall_progress()
+        assert tracker.get_sidebar_display(all_progress) == tracker.get_sidebar_display()
@@ -0,0 +1,103 @@
+"""
+Tests for saving the current chapter from the app and loading it back.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import config.constants
+from core.models.base import ChapterData
+from core.models.parts import PartManager
+from core.session import SessionManager
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / "app.py")
+
+
+class TestSaveChapter:
+    """Tests for the sidebar Save button."""
+
+    @pytest.fixture
+    def app(self, monkeypatch, tmp_path):
+        """Run the app with autosaves going to a temporary directory and a chapter loaded."""
+        monkeypatch.setattr(config.constants, "AUTOSAVE_DIR", tmp_path)
+        at = AppTest.from_file(APP_PATH, default_timeout=60)
+        at.run()
+        at.session_state["chapter_data"] = ChapterData(chapter_title="Saved", subject="history", chapter_number=3)
+        at.run()
+        return at, tmp_path / "class_10_history_ch03.json"
+
+    def saved_title(self, filepath):
+        """Helper to read the chapter title back from an autosave file."""
+        return json.loads(filepath.read_text(encoding="utf-8"))["chapter_data"]["chapter_title"]
+
+    def test_save_writes_file(self, app):
+        """Test Save writes the chapter and clears the unsaved flag."""
+        at, filepath = app
+        at.button(key="quick_save").click().run()
+        assert not at.exception
+        assert self.saved_title(filepath) == "Saved"
+        assert at.session_state["is_dirty"] is False
+
+    def test_edit_without_commit_is_still_written(self, app):
+        """Test an edit that never went through set_chapter_data (session still clean) is saved."""
+        at, filepath = app
+        at.button(key="quick_save").click().run()
+
+        at.session_state["chapter_data"].chapter_title = "Edited"
+        assert at.session_state["is_dirty"] is False
+
+        at.button(key="quick_save").click().run()
+        assert not at.exception
+        assert self.saved_title(filepath) == "Edited"
+
+    def test_unchanged_save_keeps_file(self, app):
+        """Test saving unchanged content again leaves the file untouched."""
+        at, filepath = app
+        at.button(key="quick_save").click().run()
+        mtime = filepath.stat().st_mtime_ns
+
+        at.button(key="quick_save").click().run()
+        assert filepath.stat().st_mtime_ns == mtime
+
+
+class TestLoadRecentChapter:
+    """Tests for the home page Recent Chapters Load buttons."""
+
+    @pytest.fixture
+    def app(self, monkeypatch, tmp_path):
+        """Run the home page with one valid and one invalid autosave."""
+        monkeypatch.setattr(config.constants, "AUTOSAVE_DIR", tmp_path)
+        chapter = ChapterData(chapter_title="Recent", subject="history", chapter_number=2)
+        (tmp_path / "good.json").write_text(SessionManager.serialize_export(chapter, PartManager()), encoding="utf-8")
+        (tmp_path / "bad.json").write_text('{"chapter_data": {"chapter_title": "Bad"}}', encoding="utf-8")
+        at = AppTest.from_file(APP_PATH, default_timeout=60)
+        at.run()
+        return at
+
+    def test_load_opens_chapter(self, app):
+        """Test Load imports the autosave and opens the cover page."""
+        app.button(key="load_good.json").click().run()
+        assert not app.exception
+        assert app.session_state["chapter_data"].chapter_title == "Recent"
+        assert app.session_state["current_page"] == "cover"
+
+    def test_unreadable_file_shows_error(self, app, monkeypatch):
+        """Test a file that can't be read (e.g. removed after listing) shows an error instead of raising."""
+        def missing(path):
+            raise FileNotFoundError(2, "No such file or directory")
+
+        monkeypatch.setattr(Path, "read_bytes", missing)
+        app.button(key="load_good.json").click().run()
+        assert not app.exception
+        assert app.error[0].value == "Could not open good.json: No such file or directory"
+        assert app.session_state["current_page"] == "home"
+
+    def test_invalid_file_shows_errors(self, app):
+        """Test an autosave that fails validation reports why and stays on the home page."""
+        app.button(key="load_bad.json").click().run()
+        assert not app.exception
+        assert app.error[0].value.startswith("Import failed:")
+        assert app.session_state["current_page"] == "home"
@@ -0,0 +1,141 @@
+"""
+Tests for validating uploaded import files.
+"""
+
+from io import BytesIO
+
+from app import (
+    ALLOWED_EXTENSIONS,
+    IMPORT_RENDERERS,
+    MAX_FILE_SIZE_BYTES,
+    SNIFF_BYTES,
+    render_markdown_import,
+    validate_uploaded_file,
+)
+
+
+class FakeUpload:
+    """Stand-in for a Streamlit UploadedFile: a name, a size and a readable body."""
+
+    def __init__(self, name, content, size=None):
+        self.name = name
+        self.size = len(content) if size is None else size
+        self._body = BytesIO(content)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return self._body.read(size)
+
+    def seek(self, offset, whence=0):
+        return self._body.seek(offset, whence)
+
+    def tell(self):
+        return self._body.tell()
+
+
+class TestValidateUploadedFile:
+    """Tests for validate_uploaded_file."""
+
+    def test_no_file(self):
+        """Test a missing upload is rejected."""
+        assert validate_uploaded_file(None) == (False, "No file uploaded")
+
+    def test_valid_files_accepted(self):
+        """Test each allowed type passes with matching content, and the file is rewound."""
+        uploads = [
+            FakeUpload("chapter.json", b'{"chapter_data": {}}'),
+            FakeUpload("chapter.docx", b"PK\x03\x04" + b"\x00" * 64),
+            FakeUpload("chapter.pdf", b"%PDF-1.7\n"),
+            FakeUpload("chapter.md", "# Nationalism — Part A\n".encode("utf-8")),
+            FakeUpload("chapter.markdown", b"# Title\n"),
+        ]
+        for upload in uploads:
+            assert validate_uploaded_file(upload) == (True, None), upload.name
+            assert upload.tell() == 0
+
+    def test_docx_without_zip_signature_rejected(self):
+        """Test a .docx that isn't a ZIP container is rejected."""
+        is_valid, error = validate_uploaded_file(FakeUpload("chapter.docx", b"<html>not a document</html>"))
+        assert not is_valid
+        assert "does not match" in error
+
+    def test_pdf_without_signature_rejected(self):
+        """Test a .pdf that doesn't start with %PDF is rejected."""
+        is_valid, _ = validate_uploaded_file(FakeUpload("chapter.pdf", b"MZ\x90\x00"))
+        assert not is_valid
+
+    def test_json_with_bom_or_leading_whitespace_accepted(self):
+        """Test JSON saved with a UTF-8 BOM or indented from the first line is accepted."""
+        for content in (b'\xef\xbb\xbf{"chapter_data": {}}', b'\n  \t[1, 2]', b'\xef\xbb\xbf\n {}'):
+            assert validate_uploaded_file(FakeUpload("chapter.json", content)) == (True, None), content
+
+    def test_json_not_starting_with_object_or_array_rejected(self):
+        """Test a .json whose text isn't an object or array is rejected."""
+        is_valid, _ = validate_uploaded_file(FakeUpload("chapter.json", b"<script>alert(1)</script>"))
+        assert not is_valid
+
+    def test_multibyte_char_split_at_sniff_boundary_accepted(self):
+        """Test a UTF-8 character cut in half by the sniffed prefix doesn't fail validation."""
+        prefix = b'{"title": "' + b"a" * (SNIFF_BYTES - len(b'{"title": "') - 1)
+        content = prefix + "₹".encode("utf-8") + b'"}'
+        assert len(prefix) < SNIFF_BYTES < len(prefix) + len("₹".encode("utf-8"))
+
+        assert validate_uploaded_file(FakeUpload("chapter.json", content)) == (True, None)
+
+    def test_invalid_utf8_text_rejected(self):
+        """Test text formats with bytes that aren't UTF-8 are rejected."""
+        is_valid, _ = validate_uploaded_file(FakeUpload("chapter.md", b"# Title \xff\xfe\n"))
+        assert not is_valid
+
+    def test_alternate_data_stream_name_rejected(self):
+        """Test an NTFS alternate data stream name is rejected even with an allowed extension."""
+        is_valid, error = validate_uploaded_file(FakeUpload("x.exe:$DATA.json", b"{}"))
+        assert not is_valid
+        assert error == "File name contains invalid characters"
+
+    def test_path_and_control_characters_rejected(self):
+        """Test names with path separators or control characters are rejected."""
+        for name in ("../chapter.json", "dir\\chapter.json", "chapter\x00.json", "chapter\n.json"):
+            is_valid, _ = validate_uploaded_file(FakeUpload(name, b"{}"))
+            assert not is_valid, name
+
+    def test_extension_required_and_allowed(self):
+        """Test names without an extension or with a disallowed one are rejected."""
+        is_valid, error = validate_uploaded_file(FakeUpload("chapter", b"{}"))
+        assert not is_valid
+        assert error == "File must have an extension"
+
+        is_valid, error = validate_uploaded_file(FakeUpload("chapter.exe", b"MZ"))
+        assert not is_valid
+        assert error.startswith("Invalid file type '.exe'")
+
+    def test_extension_case_insensitive(self):
+        """Test upper-case extensions are accepted."""
+        assert validate_uploaded_file(FakeUpload("CHAPTER.JSON", b"{}")) == (True, None)
+
+    def test_oversize_rejected_before_name_checked(self):
+        """Test the size check runs first: an oversize file with a bad name reports its size unread."""
+        upload = FakeUpload("x.exe:$DATA.json", b"{}", size=MAX_FILE_SIZE_BYTES + 1)
+
+        is_valid, error = validate_uploaded_file(upload)
+        assert not is_valid
+        assert "exceeds maximum allowed size" in error
+        assert upload.reads == 0
+
+    def test_size_limit_inclusive(self):
+        """Test a file of exactly the maximum size is accepted."""
+        upload = FakeUpload("chapter.json", b"{}", size=MAX_FILE_SIZE_BYTES)
+        assert validate_uploaded_file(upload) == (True, None)
+
+
+class TestImportRenderers:
+    """Tests for the upload type -> import renderer table."""
+
+    def test_every_allowed_type_has_a_renderer(self):
+        """Test each extension that passes validation has its own import renderer."""
+        assert set(IMPORT_RENDERERS) == ALLOWED_EXTENSIONS
+
+    def test_markdown_extensions_share_renderer(self):
+        """Test .md and .markdown uploads both get the Markdown preview."""
+        assert IMPORT_RENDERERS["md"] is IMPORT_RENDERERS["markdown"] is render_markdown_import
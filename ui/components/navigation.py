@@ -31,7 +31,7 @@ WORKFLOW_ORDER = [
 
 def inject_custom_css():
     """Inject custom CSS for improved UI styling."""
-    st.markdown("""
+    st.html("""
     <style>
     /* Global Font & Reset */
     .stApp {
@@ -267,7 +267,7 @@ def inject_custom_css():
         border-radius: 4px;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """)
 
 
 def render_unsaved_indicator(is_dirty: bool) -> str:
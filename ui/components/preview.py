@@ -7,9 +7,12 @@ import streamlit as st
 
 from core.models.base import ChapterData
 from core.models.parts import PartManager
+from core.session import SessionManager
 from styles.theme import Colors, Icons
 from utils.logger import get_logger
 
+from .utils import lazy_expander
+
 logger = get_logger(__name__)
 
 
@@ -1561,10 +1564,13 @@ class PreviewRenderer:
         return text
 
 
+@st.fragment
 def show_preview_panel(data: ChapterData, part_manager: PartManager = None,
                        part_id: str = None, show_full: bool = False):
     """
     Display a quick HTML preview panel in Streamlit with download options.
+    Runs as a fragment (opening/closing it doesn't rerun the page), and the
+    HTML is reused until the chapter data revision changes.
 
     Args:
         data: Chapter data to preview
@@ -1576,14 +1582,26 @@ def show_preview_panel(data: ChapterData, part_manager: PartManager = None,
 
     import streamlit.components.v1 as components
 
-    with st.expander("👁️ Quick Preview", expanded=False):
-        # Generate content HTML based on what to preview
-        if show_full and part_manager:
-            html = PreviewRenderer.render_full_preview(data, part_manager)
-        elif part_id:
-            html = PreviewRenderer.render_part_preview(data, part_id)
+    # Only build the HTML while the preview is open
+    preview_key = f"quick_preview_{'full' if show_full else part_id or 'cover'}"
+    expander = lazy_expander("👁️ Quick Preview", preview_key)
+    with expander:
+        if not expander.open:
+            return
+
+        revision = SessionManager.get_data_revision()
+        cached = st.session_state.get(f"{preview_key}_html")
+        if cached and cached[0] == revision:
+            html = cached[1]
         else:
-            html = PreviewRenderer.render_cover_preview(data)
+            # Generate content HTML based on what to preview
+            if show_full and part_manager:
+                html = PreviewRenderer.render_full_preview(data, part_manager)
+            elif part_id:
+                html = PreviewRenderer.render_part_preview(data, part_id)
+            else:
+                html = PreviewRenderer.render_cover_preview(data)
+            st.session_state[f"{preview_key}_html"] = (revision, html)
 
         # Display the HTML preview with increased height
         components.html(html, height=1200, scrolling=True)
@@ -1,6 +1,9 @@
 """
 Utility components for UI enhancement.
 """
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
 import streamlit as st
 
 def insert_at_cursor(key: str, text_to_insert: str, is_block: bool = False):
@@ -20,23 +23,24 @@ def insert_at_cursor(key: str, text_to_insert: str, is_block: bool = False):
             
         st.session_state[key] = current_text + text_to_insert
 
+# Toolbar buttons, shared by every render_markdown_toolbar call
+MARKDOWN_TOOLS = (
+    {"label": "𝐁", "help": "Bold", "insert": "**BOLD**", "block": False},
+    {"label": "𝐼", "help": "Italic", "insert": "*italic*", "block": False},
+    {"label": "•", "help": "Bullet List", "insert": "- Item", "block": True},
+    {"label": "1.", "help": "Numbered List", "insert": "1. Item", "block": True},
+    {"label": "▦", "help": "Table", "insert": "| Header 1 | Header 2 |\n|---|---|\n| Cell 1 | Cell 2 |", "block": True},
+)
+# Extra small columns for a very tight toolbar (tools, clear, spacer)
+MARKDOWN_TOOLBAR_COLUMNS = (0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 6)
+
 def render_markdown_toolbar(target_key: str):
     """
     Render a functional markdown toolbar for a specific text area.
     """
-    # Use extra small columns for a very tight toolbar
-    cols = st.columns([0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 6])
-    
-    # Define tool buttons
-    tools = [
-        {"label": "𝐁", "help": "Bold", "insert": "**BOLD**", "block": False},
-        {"label": "𝐼", "help": "Italic", "insert": "*italic*", "block": False},
-        {"label": "•", "help": "Bullet List", "insert": "- Item", "block": True},
-        {"label": "1.", "help": "Numbered List", "insert": "1. Item", "block": True},
-        {"label": "▦", "help": "Table", "insert": "| Header 1 | Header 2 |\n|---|---|\n| Cell 1 | Cell 2 |", "block": True},
-    ]
-    
-    for i, tool in enumerate(tools):
+    cols = st.columns(MARKDOWN_TOOLBAR_COLUMNS)
+
+    for i, tool in enumerate(MARKDOWN_TOOLS):
         with cols[i]:
             if st.button(tool["label"], 
                         key=f"btn_{target_key}_{i}", 
@@ -53,3 +57,133 @@ def render_markdown_toolbar(target_key: str):
 
 def get_markdown_help_caption():
     return "Supported formatting: **bold**, *italic*, - bullet point, 1. numbered list"
+
+
+def _grid_cell(value: Any) -> str:
+    """Normalize a data_editor cell (None/NaN for blank cells) to a string."""
+    if value is None or value != value:
+        return ""
+    return str(value)
+
+
+def render_grid_editor(key: str, rows: List[Dict[str, str]], columns: List[str],
+                       column_config: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+    """
+    Render an editable grid (one st.data_editor) bound to a list of row dicts.
+
+    st.data_editor keeps edits as deltas against the data it was first given,
+    so the base frame is held in session state and only rebuilt (under a new
+    widget key) when `rows` changed outside the editor, e.g. after an import,
+    or when the columns/config change (which would reset the widget anyway).
+
+    Returns:
+        The edited rows, with blank cells as empty strings.
+    """
+    state_key = f"grid_{key}"
+    state = st.session_state.get(state_key)
+    # The widget's own state is dropped when it isn't rendered for a run
+    # (e.g. inside a collapsed lazy_expander); its base must then be rebuilt too.
+    if (state is None or state['rows'] != rows or state['columns'] != columns
+            or state['column_config'] != column_config
+            or f"{key}_{state['version']}" not in st.session_state):
+        state = {
+            'version': state['version'] + 1 if state else 0,
+            'columns': list(columns),
+            'column_config': column_config,
+            'rows': rows,
+            'base': pd.DataFrame(rows, columns=columns, dtype=object),
+        }
+        st.session_state[state_key] = state
+
+    edited = st.data_editor(
+        state['base'],
+        key=f"{key}_{state['version']}",
+        column_config=column_config,
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    result = [{col: _grid_cell(row.get(col)) for col in columns} for row in edited.to_dict('records')]
+    state['rows'] = result
+    return result
+
+
+def render_lines_text_area(key: str, lines: List[str], label: str, **kwargs) -> List[str]:
+    """
+    Render a text area that edits a list of strings, one per line.
+
+    The joined text is kept in session state next to the list it came from,
+    so the list is only joined again when it was replaced elsewhere (load,
+    import) and only re-split when the text actually changed.
+
+    Returns:
+        The non-empty, stripped lines (the same list object if unchanged).
+    """
+    state_key = f"lines_{key}"
+    state = st.session_state.get(state_key)
+    if state is None or state[1] is not lines:
+        state = ("\n".join(lines) if lines else "", lines)
+
+    text = st.text_area(label, value=state[0], key=key, **kwargs)
+    if text != state[0]:
+        state = (text, [line.strip() for line in text.split("\n") if line.strip()])
+
+    st.session_state[state_key] = state
+    return state[1]
+
+
+def _commit_bound_field(obj: Any, attr: str, key: str, empty_as_none: bool) -> None:
+    """on_change callback for bind_widget: copy the widget value onto the model."""
+    value = st.session_state[key]
+    setattr(obj, attr, None if empty_as_none and not value else value)
+
+
+def bind_widget(key: str, obj: Any, attr: str, empty_as_none: bool = False, sync: bool = False) -> Dict[str, Any]:
+    """
+    Bind a widget to a model attribute through session state.
+
+    The widget state is seeded from `obj.attr` the first time the key is
+    rendered; edits are written back by an on_change callback, so nothing
+    is copied on reruns where the value didn't change. Use for widgets
+    whose value is only changed by the user (not e.g. by the markdown
+    toolbar, which writes to session state directly):
+
+        st.text_input("Title", **bind_widget(f"title_{item.widget_key}", item, "title"))
+
+    Pass sync=True for a field with controls in more than one place: the
+    widget is then re-seeded on every render, so it shows changes made
+    through the other control.
+
+    Returns:
+        The key/on_change/args kwargs for the widget call.
+    """
+    if sync or key not in st.session_state:
+        value = getattr(obj, attr)
+        st.session_state[key] = "" if value is None else value
+    return {'key': key, 'on_change': _commit_bound_field, 'args': (obj, attr, key, empty_as_none)}
+
+
+def lazy_expander(label: str, key: str, expanded: bool = False):
+    """
+    Create an expander that tracks whether it is open, so callers can skip
+    building its contents while collapsed (check `.open` on the result).
+
+    Streamlit derives the expander's identity from its label and `expanded`,
+    so a relabelled expander (e.g. after renaming an item) starts over from
+    `expanded`. The last label and open state are kept under f"{key}_state"
+    so that case reopens it as it was, while an unchanged label reuses the
+    previous arguments and keeps the identity stable.
+    """
+    state_key = f"{key}_state"
+    state = st.session_state.get(state_key)
+    if state is None:
+        expanded_arg = expanded
+    elif state[0] == label:
+        expanded_arg = state[1]
+    else:
+        expanded_arg = state[2]
+
+    expander = st.expander(label, expanded=expanded_arg, key=key, on_change="rerun")
+    st.session_state[state_key] = (label, expanded_arg, expander.open)
+    return expander
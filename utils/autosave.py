@@ -4,7 +4,10 @@ Implements throttled auto-save to prevent excessive disk writes.
 """
 
 import json
+import os
+import tempfile
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from threading import Timer
 from typing import Optional
@@ -14,6 +17,32 @@ from .logger import get_logger
 logger = get_logger(__name__)
 
 
+@contextmanager
+def atomic_open(filepath: Path, mode: str = 'wb', **kwargs):
+    """
+    Open a temporary file next to filepath for writing and rename it over
+    filepath once the block completes, so readers never see a partially
+    written file and a failed write keeps the old contents.
+    Each call gets its own temporary file, so concurrent writers of the same
+    target (e.g. the autosave timer and a Save click) can't clobber each other.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, prefix=filepath.name + '.', suffix='.tmp')
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(filepath: Path, text: str) -> None:
+    """Write text to a file atomically (see atomic_open)."""
+    with atomic_open(filepath, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
 class AutoSaveManager:
     """Manages throttled auto-save functionality."""
 
@@ -49,8 +78,7 @@ class AutoSaveManager:
         filepath = self.autosave_dir / filename
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            atomic_write_text(filepath, json.dumps(data, indent=2, ensure_ascii=False))
             self.last_save_time = time.time()
             logger.debug("Auto-saved to %s", filepath)
         except Exception as e: